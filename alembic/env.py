@@ -20,11 +20,15 @@ from src.ai_hotline.modules.identity.infrastructure.persistence.models import (
 )
 from src.ai_hotline.modules.call_processing.infrastructure.persistence.models import (
     CallModel,
-    CallSessionModel
+    CallSessionModel,
+    CallSessionEventModel
 )
 
 # Register all models with Base.metadata
-__all__ = ['TenantModel', 'UserModel', 'UserPreferencesModel', 'CallModel', 'CallSessionModel']
+__all__ = [
+    'TenantModel', 'UserModel', 'UserPreferencesModel',
+    'CallModel', 'CallSessionModel', 'CallSessionEventModel'
+]
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -49,6 +53,22 @@ def get_database_url():
     settings = get_settings()
     return settings.database_url
 
+
+def include_name(name, type_, parent_names):
+    """Only reflect tables that are declared in the target metadata.
+
+    Autogenerate primes its inspector cache with one batched ``get_multi_*``
+    query per reflection kind; filtering by name keeps those batches limited
+    to the application's own tables.
+
+    The cache is deliberately scoped to a single run: it describes the live
+    database, so a copy persisted across runs and keyed on the metadata would
+    go stale as soon as a migration is applied.
+    """
+    if type_ == "table":
+        return name in target_metadata.tables
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -94,6 +114,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection, 
             target_metadata=target_metadata,
+            include_name=include_name,
             compare_type=True,  # Enable column type comparison
             compare_server_default=True,  # Enable server default comparison
         )
@@ -0,0 +1,77 @@
+"""call_jsonb_server_defaults
+
+Revision ID: 3c7d2a91e5b4
+Revises: f1b409fc619c
+Create Date: 2026-10-15 10:04:12.318402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '3c7d2a91e5b4'
+down_revision = 'f1b409fc619c'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = {
+    'calls': {
+        'transcript_segments': "'[]'::jsonb",
+        'llm_responses': "'[]'::jsonb",
+        'context_data': "'{}'::jsonb",
+        'call_metadata': "'{}'::jsonb",
+    },
+    'call_sessions': {
+        'conversation_history': "'[]'::jsonb",
+        'session_metadata': "'{}'::jsonb",
+    },
+}
+
+ARRAY_COLUMNS = {
+    'calls': ['audio_file_paths', 'error_messages', 'automation_triggered'],
+    'call_sessions': ['pending_stt_requests', 'pending_llm_requests', 'pending_tts_requests'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in JSON_COLUMNS.items():
+        for column, default in columns.items():
+            op.alter_column(
+                table, column,
+                existing_type=sa.JSON(),
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_nullable=False,
+                server_default=sa.text(default),
+                postgresql_using=f'{column}::jsonb',
+            )
+    for table, columns in ARRAY_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column,
+                existing_type=postgresql.ARRAY(sa.String()),
+                existing_nullable=False,
+                server_default='{}',
+            )
+
+
+def downgrade() -> None:
+    for table, columns in ARRAY_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column,
+                existing_type=postgresql.ARRAY(sa.String()),
+                existing_nullable=False,
+                server_default=None,
+            )
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column,
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                type_=sa.JSON(),
+                existing_nullable=False,
+                server_default=None,
+                postgresql_using=f'{column}::json',
+            )
@@ -0,0 +1,47 @@
+"""tenant_config_jsonb
+
+Revision ID: 6a2e9d41c7f3
+Revises: d42c8f0a6b37
+Create Date: 2026-10-15 14:22:37.504118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '6a2e9d41c7f3'
+down_revision = 'd42c8f0a6b37'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = ['features', 'settings']
+
+
+def upgrade() -> None:
+    for column in JSON_COLUMNS:
+        # Older rows hold a JSON string of the serialized dict; unwrap those
+        op.alter_column(
+            'tenants', column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+            postgresql_using=(
+                f"CASE WHEN json_typeof({column}) = 'string' "
+                f"THEN ({column} #>> '{{}}')::jsonb ELSE {column}::jsonb END"
+            ),
+        )
+
+
+def downgrade() -> None:
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'tenants', column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,34 @@
+"""call_tenant_state_indexes
+
+Revision ID: 8e1f4b6c2d90
+Revises: 3c7d2a91e5b4
+Create Date: 2026-10-15 10:31:47.902215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e1f4b6c2d90'
+down_revision = '3c7d2a91e5b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_calls_tenant_status', 'calls', ['tenant_id', 'status'], unique=False)
+    op.create_index(
+        'ix_call_sessions_tenant_active',
+        'call_sessions',
+        ['tenant_id', 'last_activity_at'],
+        unique=False,
+        postgresql_where=sa.text("state NOT IN ('ended', 'error')"),
+    )
+    op.create_index('ix_call_sessions_tenant_state', 'call_sessions', ['tenant_id', 'state'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_call_sessions_tenant_state', table_name='call_sessions')
+    op.drop_index('ix_call_sessions_tenant_active', table_name='call_sessions')
+    op.drop_index('ix_calls_tenant_status', table_name='calls')
@@ -0,0 +1,58 @@
+"""identity_server_defaults
+
+Revision ID: 9b4f0c3e8a15
+Revises: 6a2e9d41c7f3
+Create Date: 2026-10-15 16:05:48.219734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '9b4f0c3e8a15'
+down_revision = '6a2e9d41c7f3'
+branch_labels = None
+depends_on = None
+
+
+SERVER_DEFAULTS = {
+    'tenants': {
+        'status': (sa.String(length=20), "'trial'"),
+        'max_users': (sa.Integer(), "5"),
+        'max_calls_per_month': (sa.Integer(), "100"),
+        'max_storage_mb': (sa.Integer(), "1000"),
+    },
+    'users': {
+        'is_active': (sa.Boolean(), "true"),
+        'is_email_verified': (sa.Boolean(), "false"),
+        'role': (sa.String(length=20), "'viewer'"),
+        'status': (sa.String(length=20), "'pending_verification'"),
+        'email_verified': (sa.Boolean(), "false"),
+        'phone_verified': (sa.Boolean(), "false"),
+        'failed_login_attempts': (sa.Integer(), "0"),
+        'timezone': (sa.String(length=50), "'UTC'"),
+        'language': (sa.String(length=10), "'en'"),
+    },
+}
+
+
+def upgrade() -> None:
+    for table, columns in SERVER_DEFAULTS.items():
+        for column, (type_, default) in columns.items():
+            op.alter_column(
+                table, column,
+                existing_type=type_,
+                existing_nullable=False,
+                server_default=sa.text(default),
+            )
+
+
+def downgrade() -> None:
+    for table, columns in SERVER_DEFAULTS.items():
+        for column, (type_, _) in columns.items():
+            op.alter_column(
+                table, column,
+                existing_type=type_,
+                existing_nullable=False,
+                server_default=None,
+            )
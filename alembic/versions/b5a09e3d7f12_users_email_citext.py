@@ -0,0 +1,35 @@
+"""users_email_citext
+
+Revision ID: b5a09e3d7f12
+Revises: 8e1f4b6c2d90
+Create Date: 2026-10-15 11:02:36.554180
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'b5a09e3d7f12'
+down_revision = '8e1f4b6c2d90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS citext')
+    op.alter_column(
+        'users', 'email',
+        existing_type=sa.String(length=255),
+        type_=postgresql.CITEXT(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'users', 'email',
+        existing_type=postgresql.CITEXT(),
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
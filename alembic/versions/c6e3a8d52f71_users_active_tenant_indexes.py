@@ -0,0 +1,38 @@
+"""users_active_tenant_indexes
+
+Revision ID: c6e3a8d52f71
+Revises: 9b4f0c3e8a15
+Create Date: 2026-10-15 16:12:04.518337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e3a8d52f71'
+down_revision = '9b4f0c3e8a15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_tenant_username_active',
+        'users',
+        ['tenant_id', 'username'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_users_tenant_id_active',
+        'users',
+        ['tenant_id', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_tenant_id_active', table_name='users')
+    op.drop_index('ix_users_tenant_username_active', table_name='users')
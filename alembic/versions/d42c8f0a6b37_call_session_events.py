@@ -0,0 +1,75 @@
+"""call_session_events
+
+Revision ID: d42c8f0a6b37
+Revises: b5a09e3d7f12
+Create Date: 2026-10-15 11:48:05.127943
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'd42c8f0a6b37'
+down_revision = 'b5a09e3d7f12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('call_session_events',
+    sa.Column('session_id', sa.String(length=100), nullable=False),
+    sa.Column('seq', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+    sa.Column('ts', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('type', sa.String(length=30), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+    sa.ForeignKeyConstraint(['session_id'], ['call_sessions.session_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('session_id', 'seq')
+    )
+    op.create_index('ix_call_session_events_ts', 'call_session_events', ['ts'], unique=False, postgresql_using='brin')
+
+    # Move existing JSON histories into the event table, preserving order
+    op.execute("""
+        INSERT INTO call_session_events (session_id, ts, type, payload)
+        SELECT
+            s.session_id,
+            COALESCE(
+                CASE jsonb_typeof(e.entry -> 'timestamp')
+                    WHEN 'number' THEN to_timestamp((e.entry ->> 'timestamp')::double precision)
+                    WHEN 'string' THEN (e.entry ->> 'timestamp')::timestamp AT TIME ZONE 'UTC'
+                END,
+                s.updated_at AT TIME ZONE 'UTC'
+            ),
+            COALESCE(e.entry ->> 'type', 'unknown'),
+            e.entry - 'type' - 'timestamp'
+        FROM call_sessions AS s
+        CROSS JOIN LATERAL jsonb_array_elements(s.conversation_history) WITH ORDINALITY AS e(entry, position)
+        ORDER BY s.session_id, e.position
+    """)
+    op.drop_column('call_sessions', 'conversation_history')
+
+
+def downgrade() -> None:
+    op.add_column('call_sessions', sa.Column(
+        'conversation_history',
+        postgresql.JSONB(astext_type=sa.Text()),
+        server_default=sa.text("'[]'::jsonb"),
+        nullable=False,
+    ))
+    op.execute("""
+        UPDATE call_sessions AS s
+        SET conversation_history = h.history
+        FROM (
+            SELECT
+                session_id,
+                jsonb_agg(
+                    payload || jsonb_build_object('type', type, 'timestamp', extract(epoch FROM ts))
+                    ORDER BY seq
+                ) AS history
+            FROM call_session_events
+            GROUP BY session_id
+        ) AS h
+        WHERE h.session_id = s.session_id
+    """)
+    op.drop_index('ix_call_session_events_ts', table_name='call_session_events', postgresql_using='brin')
+    op.drop_table('call_session_events')
@@ -5,43 +5,51 @@ A DDD-based modular monolith for processing Arabic voice calls with AI.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, Request, status
+from typing import Any, Dict, Optional
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+import orjson
 import uvicorn
 
-# Import shared components
-from src.ai_hotline.shared.config import get_app_settings, get_settings
-from src.ai_hotline.shared.database import init_database, close_database
-from src.ai_hotline.shared.logging import setup_logging, get_logger, LogConfig
-from src.ai_hotline.shared.exceptions import (
-    BaseAppException,
-    AuthenticationError,
-    AuthorizationError,
-    DomainException,
-    EntityNotFoundError,
-)
-
-# Import module routers
-from src.ai_hotline.modules.identity.presentation.routers.auth import router as auth_router
-from src.ai_hotline.shared.routers.health import router as health_router
-
-# Setup logging first
-settings = get_settings()
-log_config = LogConfig(
-    level=settings.logging.log_level,
-    format=settings.logging.log_format,
-    file_path=settings.logging.log_file_path,
-    enable_json=settings.logging.enable_json_logging
-)
-setup_logging(log_config)
+from src.ai_hotline.shared.logging import get_logger
+
 logger = get_logger("main")
 
 
+class ErrorJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, keeping non-ASCII text as UTF-8."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def configure_logging(settings) -> None:
+    """Configure application logging from settings."""
+    from src.ai_hotline.shared.logging import setup_logging, LogConfig
+
+    log_config = LogConfig(
+        level=settings.logging.log_level,
+        format=settings.logging.log_format,
+        file_path=settings.logging.log_file_path,
+        enable_json=settings.logging.enable_json_logging
+    )
+    setup_logging(log_config)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    from src.ai_hotline.shared.config import get_settings
+    from src.ai_hotline.shared.database import (
+        init_database,
+        close_database,
+        warm_connection_pool,
+    )
+    from src.ai_hotline.shared.cache import close_redis
+
+    settings = get_settings()
     logger.info("Starting AI Hotline Backend...")
     
     # Initialize database
@@ -49,30 +57,76 @@ async def lifespan(app: FastAPI):
         init_database()
         logger.info("Database initialized successfully")
         
-        # Check and apply migrations
-        from src.ai_hotline.shared.database.migrations import check_and_apply_migrations
-        migration_success = check_and_apply_migrations(auto_upgrade=settings.environment == "development")
-        if migration_success:
-            logger.info("Database migrations verified/applied successfully")
+        # Check and apply migrations (development servers only)
+        if settings.environment == "development" and not settings.skip_migrations:
+            from src.ai_hotline.shared.database.migrations import check_and_apply_migrations
+            migration_success = check_and_apply_migrations(auto_upgrade=True)
+            if migration_success:
+                logger.info("Database migrations verified/applied successfully")
+            else:
+                logger.warning("Database migration check failed - continuing anyway")
         else:
-            logger.warning("Database migration check failed - continuing anyway")
+            logger.info("Skipping startup migration check")
             
     except Exception as e:
         logger.warning(f"Database initialization failed: {e}")
         logger.info("Continuing without database connection for development")
+    else:
+        # Pre-open pooled connections so first requests skip the handshake
+        await warm_connection_pool(settings.database.pool_size)
     
     yield
     
     # Cleanup
     logger.info("Shutting down AI Hotline Backend...")
-    close_database()
+    await close_database()
+    await close_redis()
     logger.info("Application shutdown complete")
 
 
+def make_exception_handler(
+    status_code: int,
+    log_level: str,
+    label: str,
+    headers: Optional[Dict[str, str]] = None,
+):
+    """Build a handler that logs an application exception and renders it as JSON."""
+    log = getattr(logger, log_level)
+    # Details are only logged for server-side (error level) failures
+    log_details = log_level == "error"
+
+    async def exception_handler(request: Request, exc) -> ErrorJSONResponse:
+        extra = {"error_code": exc.error_code, "path": request.url.path}
+        if log_details:
+            extra["details"] = exc.details
+        log(f"{label}: {exc.message}", extra=extra)
+        return ErrorJSONResponse(
+            status_code=status_code,
+            content={
+                "error": exc.error_code,
+                "message": exc.message,
+                "details": exc.details,
+            },
+            headers=headers,
+        )
+
+    return exception_handler
+
+
 # Create FastAPI application
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    settings = get_app_settings()
+    from src.ai_hotline.shared.config import get_settings
+    from src.ai_hotline.shared.exceptions import (
+        BaseAppException,
+        AuthenticationError,
+        AuthorizationError,
+        DomainException,
+        EntityNotFoundError,
+    )
+
+    settings = get_settings()
+    configure_logging(settings)
     
     app = FastAPI(
         title=settings.title,
@@ -97,84 +151,22 @@ def create_app() -> FastAPI:
             TrustedHostMiddleware,
             allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"]
         )
-      # Global exception handlers
-    @app.exception_handler(AuthenticationError)
-    async def authentication_exception_handler(request: Request, exc: AuthenticationError):
-        logger.warning(f"Authentication error: {exc.message}", extra={
-            "error_code": exc.error_code,
-            "path": request.url.path,
-        })
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={
-                "error": exc.error_code,
-                "message": exc.message,
-                "details": exc.details,
-            },
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    @app.exception_handler(AuthorizationError)
-    async def authorization_exception_handler(request: Request, exc: AuthorizationError):
-        logger.warning(f"Authorization error: {exc.message}", extra={
-            "error_code": exc.error_code,
-            "path": request.url.path,
-        })
-        return JSONResponse(
-            status_code=status.HTTP_403_FORBIDDEN,
-            content={
-                "error": exc.error_code,
-                "message": exc.message,
-                "details": exc.details,
-            }
-        )
-
-    @app.exception_handler(EntityNotFoundError)
-    async def entity_not_found_exception_handler(request: Request, exc: EntityNotFoundError):
-        logger.info(f"Entity not found: {exc.message}", extra={
-            "error_code": exc.error_code,
-            "path": request.url.path,
-        })
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={
-                "error": exc.error_code,
-                "message": exc.message,
-                "details": exc.details,
-            }
-        )
 
-    @app.exception_handler(DomainException)
-    async def domain_exception_handler(request: Request, exc: DomainException):
-        logger.error(f"Domain error: {exc.message}", extra={
-            "error_code": exc.error_code,
-            "details": exc.details,
-            "path": request.url.path,
-        })
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error": exc.error_code,
-                "message": exc.message,
-                "details": exc.details,
-            }
+    # Global exception handlers (status, log level, log label, headers)
+    bearer_challenge = {"WWW-Authenticate": "Bearer"}
+    exception_responses = [
+        (AuthenticationError, status.HTTP_401_UNAUTHORIZED, "warning", "Authentication error", bearer_challenge),
+        (AuthorizationError, status.HTTP_403_FORBIDDEN, "warning", "Authorization error", None),
+        (EntityNotFoundError, status.HTTP_404_NOT_FOUND, "info", "Entity not found", None),
+        (DomainException, status.HTTP_422_UNPROCESSABLE_ENTITY, "error", "Domain error", None),
+        (BaseAppException, status.HTTP_400_BAD_REQUEST, "error", "Application error", None),
+    ]
+    for exc_class, status_code, log_level, label, headers in exception_responses:
+        app.add_exception_handler(
+            exc_class,
+            make_exception_handler(status_code, log_level, label, headers),
         )
 
-    @app.exception_handler(BaseAppException)
-    async def app_exception_handler(request: Request, exc: BaseAppException):
-        logger.error(f"Application error: {exc.message}", extra={
-            "error_code": exc.error_code,
-            "details": exc.details,
-            "path": request.url.path,
-        })
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": exc.error_code,
-                "message": exc.message,
-                "details": exc.details,
-            }
-        )
       # Health check endpoint (legacy - kept for backward compatibility)
     @app.get("/health", tags=["Health"])
     async def health_check():
@@ -191,6 +183,9 @@ def create_app() -> FastAPI:
             "docs": "/docs",
             "health": "/health",
         }      # Include module routers
+    from src.ai_hotline.modules.identity.presentation.routers.auth import router as auth_router
+    from src.ai_hotline.shared.routers.health import router as health_router
+
     app.include_router(health_router, tags=["Health"])
     app.include_router(auth_router, prefix="/api/v1/auth", tags=["Authentication"])
     # app.include_router(call_router, prefix="/api/v1/calls", tags=["Call Processing"])
@@ -203,15 +198,28 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create application instance
-app = create_app()
+# Application instance, built on first access
+_app: FastAPI | None = None
+
+
+def __getattr__(name: str):
+    """Build the application lazily when ``main.app`` is first requested."""
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    settings = get_app_settings()
+    from src.ai_hotline.shared.config import get_settings
+
+    settings = get_settings()
     
     uvicorn.run(
-        "main:app",
+        "main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
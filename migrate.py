@@ -7,29 +7,33 @@ This script provides easy commands for managing database migrations using Alembi
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 
-# Add the project root to Python path
+from alembic import command
+from alembic.config import Config
+from alembic.util import CommandError
+
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root / 'src'))
 
-def run_alembic_command(command_args):
-    """Run an alembic command."""
+_alembic_config = None
+
+def get_alembic_config():
+    """Load the alembic configuration once per process."""
+    global _alembic_config
+    if _alembic_config is None:
+        _alembic_config = Config(str(project_root / 'alembic.ini'))
+        _alembic_config.set_main_option('script_location', str(project_root / 'alembic'))
+    return _alembic_config
+
+def run_alembic_command(command_func, *args, **kwargs):
+    """Run an alembic command in-process."""
     try:
-        result = subprocess.run(
-            ['python', '-m', 'alembic'] + command_args,
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        
-        return result.returncode == 0
+        command_func(get_alembic_config(), *args, **kwargs)
+        return True
+    except CommandError as e:
+        print(f"Alembic error: {e}", file=sys.stderr)
+        return False
     except Exception as e:
         print(f"Error running alembic command: {e}", file=sys.stderr)
         return False
@@ -37,32 +41,32 @@ def run_alembic_command(command_args):
 def create_migration(message):
     """Create a new migration."""
     print(f"Creating migration: {message}")
-    return run_alembic_command(['revision', '--autogenerate', '-m', message])
+    return run_alembic_command(command.revision, message=message, autogenerate=True)
 
 def upgrade_database(revision='head'):
     """Upgrade database to a specific revision."""
     print(f"Upgrading database to {revision}")
-    return run_alembic_command(['upgrade', revision])
+    return run_alembic_command(command.upgrade, revision)
 
 def downgrade_database(revision):
     """Downgrade database to a specific revision."""
     print(f"Downgrading database to {revision}")
-    return run_alembic_command(['downgrade', revision])
+    return run_alembic_command(command.downgrade, revision)
 
 def show_current_revision():
     """Show current database revision."""
     print("Current database revision:")
-    return run_alembic_command(['current'])
+    return run_alembic_command(command.current)
 
 def show_history():
     """Show migration history."""
     print("Migration history:")
-    return run_alembic_command(['history'])
+    return run_alembic_command(command.history)
 
 def show_pending():
     """Show pending migrations."""
     print("Pending migrations:")
-    return run_alembic_command(['current', '--verbose'])
+    return run_alembic_command(command.current, verbose=True)
 
 def init_database():
     """Initialize database with all migrations."""
@@ -1,11 +1,30 @@
 """Call entity for the call processing domain."""
 
-from datetime import datetime
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
-from .....shared.database.models import BaseEntity
+import orjson
+
+# Everything except digits and "+" is stripped from incoming phone numbers
+_PHONE_STRIP_PATTERN = re.compile(r'[^\d+]')
+
+# End reasons that mark a call as failed or cancelled (failure wins)
+_FAILURE_REASON_PATTERN = re.compile('error', re.IGNORECASE)
+_CANCEL_REASON_PATTERN = re.compile('cancel', re.IGNORECASE)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp_ns_to_datetime(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert nanoseconds since the epoch to a naive UTC datetime."""
+    if timestamp_ns is None:
+        return None
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
 
 
 class CallStatus(str, Enum):
@@ -19,6 +38,18 @@ class CallStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+_ACTIVE_STATUSES = frozenset({
+    CallStatus.RINGING,
+    CallStatus.IN_PROGRESS,
+    CallStatus.ON_HOLD,
+})
+_COMPLETED_STATUSES = frozenset({
+    CallStatus.COMPLETED,
+    CallStatus.FAILED,
+    CallStatus.CANCELLED,
+})
+
+
 class CallDirection(str, Enum):
     """Call direction enumeration."""
     INBOUND = "inbound"
@@ -33,9 +64,60 @@ class CallPriority(str, Enum):
     URGENT = "urgent"
 
 
-class Call(BaseEntity):
+@dataclass(frozen=True, slots=True)
+class CallSummary:
+    """Read-only summary of a call."""
+    
+    call_id: UUID
+    phone_number: str
+    caller_name: Optional[str]
+    direction: CallDirection
+    status: CallStatus
+    priority: CallPriority
+    duration_seconds: Optional[int]
+    started_at: Optional[datetime]
+    ended_at: Optional[datetime]
+    transcript_segments_count: int
+    llm_responses_count: int
+    audio_files_count: int
+    automations_triggered: Tuple[str, ...]
+    satisfaction_score: Optional[float]
+    resolution_achieved: Optional[bool]
+    
+    def to_json(self) -> bytes:
+        """Serialize the summary to JSON (UUIDs and timestamps formatted by orjson)."""
+        return orjson.dumps(self)
+
+
+class Call:
     """Call entity representing a phone call interaction."""
     
+    __slots__ = (
+        "id",
+        "tenant_id",
+        "phone_number",
+        "caller_name",
+        "direction",
+        "status",
+        "priority",
+        "started_at",
+        "ended_at",
+        "duration_seconds",
+        "metadata",
+        "session_id",
+        "_audio_file_paths",
+        "_audio_file_path_set",
+        "_transcript_segments",
+        "_transcript_lines",
+        "_llm_responses",
+        "_error_messages",
+        "context_data",
+        "automation_triggered",
+        "_automation_set",
+        "satisfaction_score",
+        "resolution_achieved",
+    )
+    
     def __init__(
         self,
         tenant_id: UUID,
@@ -46,38 +128,62 @@ class Call(BaseEntity):
         priority: CallPriority = CallPriority.NORMAL,
         metadata: Optional[Dict[str, Any]] = None,
     ):
-        super().__init__(call_id)
+        self.id = call_id or uuid4()
         self.tenant_id = tenant_id
         self.phone_number = self._validate_phone_number(phone_number)
         self.caller_name = caller_name
         self.direction = direction
         self.status = CallStatus.INITIATED
         self.priority = priority
-        self.started_at: Optional[datetime] = None
-        self.ended_at: Optional[datetime] = None
+        # Timestamps are nanoseconds since the epoch (time.time_ns())
+        self.started_at: Optional[int] = None
+        self.ended_at: Optional[int] = None
         self.duration_seconds: Optional[int] = None
         self.metadata = metadata or {}
         
-        # Call session data
+        # Call session data (lists are allocated on first append)
         self.session_id: Optional[str] = None
-        self.audio_file_paths: List[str] = []
-        self.transcript_segments: List[Dict[str, Any]] = []
-        self.llm_responses: List[Dict[str, Any]] = []
-        self.error_messages: List[str] = []
+        self._audio_file_paths: Optional[List[str]] = None
+        self._audio_file_path_set: Optional[Set[str]] = None
+        self._transcript_segments: Optional[List[Dict[str, Any]]] = None
+        self._transcript_lines: Optional[List[str]] = None
+        self._llm_responses: Optional[List[Dict[str, Any]]] = None
+        self._error_messages: Optional[List[str]] = None
         
         # Business context
         self.context_data: Dict[str, Any] = {}
         self.automation_triggered: List[str] = []
+        self._automation_set: Optional[Set[str]] = None
         self.satisfaction_score: Optional[float] = None
         self.resolution_achieved: Optional[bool] = None
     
+    @property
+    def audio_file_paths(self) -> Sequence[str]:
+        """Audio file paths recorded for the call."""
+        return () if self._audio_file_paths is None else self._audio_file_paths
+    
+    @property
+    def transcript_segments(self) -> Sequence[Dict[str, Any]]:
+        """Transcript segments recorded for the call."""
+        return () if self._transcript_segments is None else self._transcript_segments
+    
+    @property
+    def llm_responses(self) -> Sequence[Dict[str, Any]]:
+        """LLM responses recorded for the call."""
+        return () if self._llm_responses is None else self._llm_responses
+    
+    @property
+    def error_messages(self) -> Sequence[str]:
+        """Error messages recorded for the call."""
+        return () if self._error_messages is None else self._error_messages
+    
     def _validate_phone_number(self, phone_number: str) -> str:
         """Validate phone number format."""
         if not phone_number:
             raise ValueError("Phone number cannot be empty")
         
         # Remove all non-digit characters except +
-        cleaned = ''.join(c for c in phone_number if c.isdigit() or c == '+')
+        cleaned = _PHONE_STRIP_PATTERN.sub('', phone_number)
         
         if not cleaned:
             raise ValueError("Phone number must contain digits")
@@ -93,49 +199,63 @@ class Call(BaseEntity):
             raise ValueError(f"Cannot start call in status: {self.status}")
         
         self.status = CallStatus.IN_PROGRESS
-        self.started_at = datetime.utcnow()
+        self.started_at = time.time_ns()
         self.session_id = session_id
     
     def end_call(self, reason: Optional[str] = None) -> None:
         """End the call."""
-        if self.status in [CallStatus.COMPLETED, CallStatus.FAILED, CallStatus.CANCELLED]:
+        if self.status in _COMPLETED_STATUSES:
             raise ValueError(f"Call already ended with status: {self.status}")
         
-        self.ended_at = datetime.utcnow()
+        self.ended_at = time.time_ns()
         
         if self.started_at:
-            duration = self.ended_at - self.started_at
-            self.duration_seconds = int(duration.total_seconds())
+            self.duration_seconds = (self.ended_at - self.started_at) // 1_000_000_000
         
         # Determine final status
-        if reason and "error" in reason.lower():
+        if reason and _FAILURE_REASON_PATTERN.search(reason):
             self.status = CallStatus.FAILED
-            self.error_messages.append(reason)
-        elif reason and "cancel" in reason.lower():
+            if self._error_messages is None:
+                self._error_messages = []
+            self._error_messages.append(reason)
+        elif reason and _CANCEL_REASON_PATTERN.search(reason):
             self.status = CallStatus.CANCELLED
         else:
             self.status = CallStatus.COMPLETED
     
     def add_audio_file(self, file_path: str) -> None:
         """Add audio file path to the call."""
-        if file_path and file_path not in self.audio_file_paths:
-            self.audio_file_paths.append(file_path)
+        if not file_path:
+            return
+        if self._audio_file_paths is None:
+            self._audio_file_paths = []
+            self._audio_file_path_set = set()
+        if file_path not in self._audio_file_path_set:
+            self._audio_file_path_set.add(file_path)
+            self._audio_file_paths.append(file_path)
     
     def add_transcript_segment(
         self,
         text: str,
         speaker: str,
-        timestamp: datetime,
+        timestamp: Optional[int] = None,
         confidence: Optional[float] = None
     ) -> None:
-        """Add a transcript segment to the call."""
+        """Add a transcript segment to the call.
+        
+        ``timestamp`` is in nanoseconds since the epoch and defaults to now.
+        """
         segment = {
             "text": text,
             "speaker": speaker,
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp if timestamp is not None else time.time_ns(),
             "confidence": confidence
         }
-        self.transcript_segments.append(segment)
+        if self._transcript_segments is None:
+            self._transcript_segments = []
+            self._transcript_lines = []
+        self._transcript_segments.append(segment)
+        self._transcript_lines.append(f"{speaker}: {text}")
     
     def add_llm_response(
         self,
@@ -143,21 +263,26 @@ class Call(BaseEntity):
         prompt: str,
         response: str,
         model: str,
-        timestamp: datetime,
+        timestamp: Optional[int] = None,
         processing_time_ms: Optional[int] = None,
         tokens_used: Optional[int] = None
     ) -> None:
-        """Add LLM response to the call."""
+        """Add LLM response to the call.
+        
+        ``timestamp`` is in nanoseconds since the epoch and defaults to now.
+        """
         llm_response = {
             "provider": provider,
             "model": model,
             "prompt": prompt,
             "response": response,
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp if timestamp is not None else time.time_ns(),
             "processing_time_ms": processing_time_ms,
             "tokens_used": tokens_used
         }
-        self.llm_responses.append(llm_response)
+        if self._llm_responses is None:
+            self._llm_responses = []
+        self._llm_responses.append(llm_response)
     
     def set_context_data(self, key: str, value: Any) -> None:
         """Set context data for the call."""
@@ -169,7 +294,10 @@ class Call(BaseEntity):
     
     def trigger_automation(self, automation_name: str) -> None:
         """Record automation trigger."""
-        if automation_name not in self.automation_triggered:
+        if self._automation_set is None:
+            self._automation_set = set()
+        if automation_name not in self._automation_set:
+            self._automation_set.add(automation_name)
             self.automation_triggered.append(automation_name)
     
     def set_satisfaction_score(self, score: float) -> None:
@@ -184,43 +312,38 @@ class Call(BaseEntity):
     
     def get_full_transcript(self) -> str:
         """Get the full call transcript as a single string."""
-        if not self.transcript_segments:
+        if not self._transcript_lines:
             return ""
         
-        transcript_lines = []
-        for segment in self.transcript_segments:
-            speaker = segment.get("speaker", "Unknown")
-            text = segment.get("text", "")
-            transcript_lines.append(f"{speaker}: {text}")
-        
-        return "\n".join(transcript_lines)
+        # Lines are formatted as "speaker: text" when segments are added
+        return "\n".join(self._transcript_lines)
     
-    def get_call_summary(self) -> Dict[str, Any]:
+    def get_call_summary(self) -> CallSummary:
         """Get a summary of the call."""
-        return {
-            "call_id": str(self.id),
-            "phone_number": self.phone_number,
-            "caller_name": self.caller_name,
-            "direction": self.direction,
-            "status": self.status,
-            "priority": self.priority,
-            "duration_seconds": self.duration_seconds,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
-            "transcript_segments_count": len(self.transcript_segments),
-            "llm_responses_count": len(self.llm_responses),
-            "audio_files_count": len(self.audio_file_paths),
-            "automations_triggered": self.automation_triggered,
-            "satisfaction_score": self.satisfaction_score,
-            "resolution_achieved": self.resolution_achieved,
-        }
+        return CallSummary(
+            call_id=self.id,
+            phone_number=self.phone_number,
+            caller_name=self.caller_name,
+            direction=self.direction,
+            status=self.status,
+            priority=self.priority,
+            duration_seconds=self.duration_seconds,
+            started_at=_timestamp_ns_to_datetime(self.started_at),
+            ended_at=_timestamp_ns_to_datetime(self.ended_at),
+            transcript_segments_count=len(self.transcript_segments),
+            llm_responses_count=len(self.llm_responses),
+            audio_files_count=len(self.audio_file_paths),
+            automations_triggered=tuple(self.automation_triggered),
+            satisfaction_score=self.satisfaction_score,
+            resolution_achieved=self.resolution_achieved,
+        )
     
     @property
     def is_active(self) -> bool:
         """Check if the call is currently active."""
-        return self.status in [CallStatus.RINGING, CallStatus.IN_PROGRESS, CallStatus.ON_HOLD]
+        return self.status in _ACTIVE_STATUSES
     
     @property
     def is_completed(self) -> bool:
         """Check if the call has been completed."""
-        return self.status in [CallStatus.COMPLETED, CallStatus.FAILED, CallStatus.CANCELLED]
+        return self.status in _COMPLETED_STATUSES
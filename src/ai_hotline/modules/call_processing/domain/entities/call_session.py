@@ -1,11 +1,34 @@
-"""Call session entity for managing real-time call state."""
+"""Call session entity for managing real-time call state.
 
-from datetime import datetime
+Timestamps are stored as ``time.time()`` floats, including the ``timestamp``
+field of conversation history entries; use ``timestamp_to_iso`` to format them.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from itertools import islice
+from typing import Optional, Dict, Any, ClassVar, Deque, Iterable, List, Set
 from uuid import UUID, uuid4
 
 
+# Conversation history is a ring buffer; only the most recent events are kept.
+HISTORY_MAX_LENGTH = 512
+# Events awaiting take_new_events(); older ones are dropped (and counted)
+# if the queue is not drained in time.
+PENDING_EVENTS_MAX_LENGTH = 1024
+DEFAULT_MAX_TURNS = 10
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def timestamp_to_iso(timestamp: float) -> str:
+    """Convert seconds since the epoch to a naive UTC ISO-8601 string."""
+    return (_EPOCH + timedelta(seconds=timestamp)).isoformat()
+
+
 class SessionState(str, Enum):
     """Call session state enumeration."""
     INITIALIZING = "initializing"
@@ -26,6 +49,75 @@ class ConversationTurn(str, Enum):
     SYSTEM = "system"
 
 
+@dataclass(frozen=True, slots=True)
+class HistoryEvent:
+    """Base class for conversation history entries."""
+    
+    type: ClassVar[str]
+    
+    timestamp: float
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the JSON representation used for storage and LLM context."""
+        data = {"type": self.type}
+        for field in fields(self):
+            data[field.name] = getattr(self, field.name)
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class StateChange(HistoryEvent):
+    """Session state transition."""
+    
+    type: ClassVar[str] = "state_change"
+    
+    from_state: SessionState
+    to_state: SessionState
+    reason: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class UserTurn(HistoryEvent):
+    """Caller speech recognized by STT."""
+    
+    type: ClassVar[str] = "user_input"
+    
+    text: str
+    confidence: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True)
+class AiTurn(HistoryEvent):
+    """Response generated by the LLM."""
+    
+    type: ClassVar[str] = "ai_response"
+    
+    text: str
+    provider: str
+    model: str
+    processing_time_ms: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SystemMessage(HistoryEvent):
+    """Informational message from the system."""
+    
+    type: ClassVar[str] = "system_message"
+    
+    message: str
+    level: str = "info"
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorEntry(HistoryEvent):
+    """Error raised while handling the session."""
+    
+    type: ClassVar[str] = "error"
+    
+    message: str
+    error_count: int
+
+
 class CallSession:
     """Call session entity for managing real-time call interactions."""
     
@@ -34,17 +126,50 @@ class CallSession:
         call_id: UUID,
         tenant_id: UUID,
         session_id: Optional[str] = None,
+        max_context_turns: int = DEFAULT_MAX_TURNS,
     ):
+        # Containers are created once and cleared in reset() so pooled
+        # sessions reuse them.
+        self.conversation_history: Deque[HistoryEvent] = deque(maxlen=HISTORY_MAX_LENGTH)
+        # Recent user inputs and AI responses, max_context_turns of each
+        self._dialog_turns: Deque[HistoryEvent] = deque(maxlen=2 * max_context_turns)
+        # Events recorded since the last take_new_events(), for persistence
+        self._new_events: Deque[HistoryEvent] = deque(maxlen=PENDING_EVENTS_MAX_LENGTH)
+        
+        # Processing state (convert with list() when persisting to ARRAY columns)
+        self.pending_stt_requests: Set[str] = set()
+        self.pending_llm_requests: Set[str] = set()
+        self.pending_tts_requests: Set[str] = set()
+        self._pending_buckets: Dict[str, Set[str]] = {
+            "stt": self.pending_stt_requests,
+            "llm": self.pending_llm_requests,
+            "tts": self.pending_tts_requests,
+        }
+        
+        # Session metadata
+        self.metadata: Dict[str, Any] = {}
+        
+        self.reset(call_id, tenant_id, session_id)
+    
+    def reset(
+        self,
+        call_id: UUID,
+        tenant_id: UUID,
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Re-initialize the session in place for a new call."""
         self.session_id = session_id or str(uuid4())
         self.call_id = call_id
         self.tenant_id = tenant_id
+        # Always a SessionState member, so internal checks compare by identity
         self.state = SessionState.INITIALIZING
         self.current_turn = ConversationTurn.AI  # AI speaks first typically
         
-        # Session timing
-        self.created_at = datetime.utcnow()
-        self.last_activity_at = datetime.utcnow()
-        self.state_changed_at = datetime.utcnow()
+        # Session timing (seconds since the epoch, from time.time())
+        now = time.time()
+        self.created_at: float = now
+        self.last_activity_at: float = now
+        self.state_changed_at: float = now
         
         # Audio processing state
         self.current_audio_stream_id: Optional[str] = None
@@ -52,15 +177,14 @@ class CallSession:
         self.is_playing: bool = False
         
         # Conversation context
-        self.conversation_history: List[Dict[str, Any]] = []
-        self.current_prompt: Optional[str] = None
-        self.last_user_input: Optional[str] = None
-        self.last_ai_response: Optional[str] = None
+        self.clear_conversation()
+        # Events that fell out of the pending queue before being taken
+        self.dropped_event_count: int = 0
+        self._conversation_turn_count: int = 0
         
-        # Processing state
-        self.pending_stt_requests: List[str] = []
-        self.pending_llm_requests: List[str] = []
-        self.pending_tts_requests: List[str] = []
+        self.pending_stt_requests.clear()
+        self.pending_llm_requests.clear()
+        self.pending_tts_requests.clear()
         
         # Session configuration
         self.max_silence_duration_seconds: int = 10
@@ -71,33 +195,35 @@ class CallSession:
         self.error_count: int = 0
         self.last_error: Optional[str] = None
         self.retry_count: int = 0
-        
-        # Session metadata
-        self.metadata: Dict[str, Any] = {}
+    
+    def clear_conversation(self) -> None:
+        """Drop all conversation content: history, queued events, prompts and metadata."""
+        self.conversation_history.clear()
+        self._dialog_turns.clear()
+        self._new_events.clear()
+        self.current_prompt: Optional[str] = None
+        self.last_user_input: Optional[str] = None
+        self.last_ai_response: Optional[str] = None
+        self.metadata.clear()
     
     def change_state(self, new_state: SessionState, reason: Optional[str] = None) -> None:
         """Change the session state."""
         if self.state == new_state:
             return
         
+        now = time.time()
         old_state = self.state
-        self.state = new_state
-        self.state_changed_at = datetime.utcnow()
-        self.last_activity_at = datetime.utcnow()
+        self.state = SessionState(new_state)
+        self.state_changed_at = now
+        self.last_activity_at = now
         
         # Log state change in conversation history
-        self.conversation_history.append({
-            "type": "state_change",
-            "from_state": old_state,
-            "to_state": new_state,
-            "reason": reason,
-            "timestamp": self.state_changed_at.isoformat()
-        })
+        self._record(StateChange(now, old_state, self.state, reason))
     
     def set_turn(self, turn: ConversationTurn) -> None:
         """Set whose turn it is to speak."""
         self.current_turn = turn
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = time.time()
     
     def start_recording(self, stream_id: str) -> None:
         """Start recording audio."""
@@ -108,7 +234,7 @@ class CallSession:
     def stop_recording(self) -> None:
         """Stop recording audio."""
         self.is_recording = False
-        if self.state == SessionState.LISTENING:
+        if self.state is SessionState.LISTENING:
             self.change_state(SessionState.PROCESSING, "Stopped recording audio")
     
     def start_playing(self) -> None:
@@ -119,24 +245,20 @@ class CallSession:
     def stop_playing(self) -> None:
         """Stop playing audio to caller."""
         self.is_playing = False
-        if self.state == SessionState.SPEAKING:
+        if self.state is SessionState.SPEAKING:
             self.change_state(SessionState.WAITING_FOR_RESPONSE, "Finished playing audio")
             self.set_turn(ConversationTurn.CALLER)
     
     def add_user_input(self, text: str, confidence: Optional[float] = None) -> None:
         """Add user input from STT."""
+        now = time.time()
         self.last_user_input = text
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = now
         
-        self.conversation_history.append({
-            "type": "user_input",
-            "text": text,
-            "confidence": confidence,
-            "timestamp": self.last_activity_at.isoformat()
-        })
+        self._add_dialog_turn(UserTurn(now, text, confidence))
         
         # Move to processing state
-        if self.state == SessionState.LISTENING:
+        if self.state is SessionState.LISTENING:
             self.change_state(SessionState.PROCESSING, "Received user input")
     
     def add_ai_response(
@@ -147,38 +269,47 @@ class CallSession:
         processing_time_ms: Optional[int] = None
     ) -> None:
         """Add AI response from LLM."""
+        now = time.time()
         self.last_ai_response = text
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = now
         
-        self.conversation_history.append({
-            "type": "ai_response",
-            "text": text,
-            "provider": provider,
-            "model": model,
-            "processing_time_ms": processing_time_ms,
-            "timestamp": self.last_activity_at.isoformat()
-        })
+        self._add_dialog_turn(AiTurn(now, text, provider, model, processing_time_ms))
+    
+    def _record(self, event: HistoryEvent) -> None:
+        """Append an event to the history and the not-yet-persisted queue."""
+        self.conversation_history.append(event)
+        pending = self._new_events
+        if len(pending) == pending.maxlen:
+            self.dropped_event_count += 1
+        pending.append(event)
+    
+    def take_new_events(self) -> List[HistoryEvent]:
+        """
+        Return events recorded since the last call, for appending to storage.
+        
+        At most ``PENDING_EVENTS_MAX_LENGTH`` events are kept between calls;
+        older ones are dropped and counted in ``dropped_event_count``.
+        """
+        events = list(self._new_events)
+        self._new_events.clear()
+        return events
+    
+    def _add_dialog_turn(self, turn: HistoryEvent) -> None:
+        """Record a user input or AI response in both history buffers."""
+        self._record(turn)
+        self._dialog_turns.append(turn)
+        self._conversation_turn_count += 1
     
     def add_system_message(self, message: str, level: str = "info") -> None:
         """Add system message to conversation history."""
-        self.conversation_history.append({
-            "type": "system_message",
-            "message": message,
-            "level": level,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        self._record(SystemMessage(time.time(), message, level))
     
     def add_error(self, error_message: str) -> None:
         """Add error to session."""
         self.error_count += 1
         self.last_error = error_message
         
-        self.conversation_history.append({
-            "type": "error",
-            "message": error_message,
-            "error_count": self.error_count,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        self._record(ErrorEntry(time.time(), error_message, self.error_count))
         
         # Change to error state if too many errors
         if self.error_count >= 3:
@@ -186,24 +317,15 @@ class CallSession:
     
     def add_pending_request(self, request_type: str, request_id: str) -> None:
         """Add pending request to track async operations."""
-        if request_type == "stt":
-            self.pending_stt_requests.append(request_id)
-        elif request_type == "llm":
-            self.pending_llm_requests.append(request_id)
-        elif request_type == "tts":
-            self.pending_tts_requests.append(request_id)
+        bucket = self._pending_buckets.get(request_type)
+        if bucket is not None:
+            bucket.add(request_id)
     
     def remove_pending_request(self, request_type: str, request_id: str) -> None:
-        """Remove completed request from pending list."""
-        try:
-            if request_type == "stt" and request_id in self.pending_stt_requests:
-                self.pending_stt_requests.remove(request_id)
-            elif request_type == "llm" and request_id in self.pending_llm_requests:
-                self.pending_llm_requests.remove(request_id)
-            elif request_type == "tts" and request_id in self.pending_tts_requests:
-                self.pending_tts_requests.remove(request_id)
-        except ValueError:
-            pass  # Request not in list
+        """Remove completed request from pending set."""
+        bucket = self._pending_buckets.get(request_type)
+        if bucket is not None:
+            bucket.discard(request_id)
     
     def set_metadata(self, key: str, value: Any) -> None:
         """Set session metadata."""
@@ -213,17 +335,35 @@ class CallSession:
         """Get session metadata."""
         return self.metadata.get(key, default)
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if session has expired."""
-        now = datetime.utcnow()
-        session_age = (now - self.created_at).total_seconds()
-        return session_age > self.max_session_duration_seconds
+        if now is None:
+            now = time.time()
+        return now - self.created_at > self.max_session_duration_seconds
     
-    def is_idle(self) -> bool:
+    def is_idle(self, now: Optional[float] = None) -> bool:
         """Check if session has been idle too long."""
-        now = datetime.utcnow()
-        idle_time = (now - self.last_activity_at).total_seconds()
-        return idle_time > self.max_silence_duration_seconds
+        if now is None:
+            now = time.time()
+        return now - self.last_activity_at > self.max_silence_duration_seconds
+    
+    @staticmethod
+    def check_expired_batch(
+        sessions: Iterable["CallSession"], now: Optional[float] = None
+    ) -> List["CallSession"]:
+        """Return the expired sessions, reading the clock once for the whole sweep."""
+        if now is None:
+            now = time.time()
+        return [s for s in sessions if now - s.created_at > s.max_session_duration_seconds]
+    
+    @staticmethod
+    def check_idle_batch(
+        sessions: Iterable["CallSession"], now: Optional[float] = None
+    ) -> List["CallSession"]:
+        """Return the idle sessions, reading the clock once for the whole sweep."""
+        if now is None:
+            now = time.time()
+        return [s for s in sessions if now - s.last_activity_at > s.max_silence_duration_seconds]
     
     def has_pending_requests(self) -> bool:
         """Check if there are any pending async requests."""
@@ -233,16 +373,31 @@ class CallSession:
             self.pending_tts_requests
         )
     
-    def get_conversation_context(self, max_turns: int = 10) -> List[Dict[str, Any]]:
-        """Get recent conversation context for LLM prompts."""
-        # Filter only user inputs and AI responses
-        relevant_turns = [
-            turn for turn in self.conversation_history
-            if turn["type"] in ["user_input", "ai_response"]
-        ]
+    @property
+    def context_capacity(self) -> int:
+        """Number of recent user inputs and AI responses kept for context."""
+        return self._dialog_turns.maxlen
+    
+    def get_conversation_context(self, max_turns: int = DEFAULT_MAX_TURNS) -> List[Dict[str, Any]]:
+        """
+        Get recent conversation context for LLM prompts.
         
-        # Return last N turns
-        return relevant_turns[-max_turns:] if relevant_turns else []
+        Args:
+            max_turns: Number of most recent user inputs and AI responses to
+                return; may not exceed ``context_capacity`` (twice the
+                ``max_context_turns`` the session was created with)
+            
+        Raises:
+            ValueError: If more turns are requested than the session keeps
+        """
+        turns = self._dialog_turns
+        if max_turns > turns.maxlen:
+            raise ValueError(
+                f"max_turns={max_turns} exceeds the {turns.maxlen} turns kept by this session"
+            )
+        if max_turns <= 0:
+            return []
+        return [turn.as_dict() for turn in islice(turns, max(0, len(turns) - max_turns), None)]
     
     def end_session(self, reason: str = "Session ended") -> None:
         """End the session."""
@@ -257,19 +412,17 @@ class CallSession:
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Get session summary."""
-        now = datetime.utcnow()
-        duration = (now - self.created_at).total_seconds()
+        duration = time.time() - self.created_at
         
         return {
             "session_id": self.session_id,
             "call_id": str(self.call_id),
             "state": self.state,
             "current_turn": self.current_turn,
+            "created_at": timestamp_to_iso(self.created_at),
+            "last_activity_at": timestamp_to_iso(self.last_activity_at),
             "duration_seconds": int(duration),
-            "conversation_turns": len([
-                t for t in self.conversation_history 
-                if t["type"] in ["user_input", "ai_response"]
-            ]),
+            "conversation_turns": self._conversation_turn_count,
             "error_count": self.error_count,
             "last_error": self.last_error,
             "is_recording": self.is_recording,
@@ -280,3 +433,40 @@ class CallSession:
                 "tts": len(self.pending_tts_requests),
             }
         }
+
+
+class CallSessionPool:
+    """Recycles ended CallSession instances to avoid re-allocating them per call."""
+    
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._free: Deque[CallSession] = deque()
+    
+    def acquire(
+        self,
+        call_id: UUID,
+        tenant_id: UUID,
+        session_id: Optional[str] = None,
+    ) -> CallSession:
+        """Get a session for a new call, reusing a released one if available."""
+        try:
+            session = self._free.pop()
+        except IndexError:
+            return CallSession(call_id, tenant_id, session_id)
+        
+        session.reset(call_id, tenant_id, session_id)
+        return session
+    
+    def release(self, session: CallSession) -> None:
+        """Return a session to the pool once nothing references it anymore.
+        
+        Conversation content is dropped immediately so it does not linger
+        while the session waits to be reused.
+        """
+        session.clear_conversation()
+        
+        if len(self._free) < self.max_size:
+            self._free.append(session)
+    
+    def __len__(self) -> int:
+        return len(self._free)
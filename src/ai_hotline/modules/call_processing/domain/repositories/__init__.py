@@ -0,0 +1,20 @@
+"""Repository interfaces for call processing domain."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Sequence
+
+from ..entities.call_session import HistoryEvent
+
+
+class ICallSessionEventRepository(ABC):
+    """Call session event (conversation history) repository interface."""
+    
+    @abstractmethod
+    async def add_events(self, session_id: str, events: Sequence[HistoryEvent]) -> int:
+        """Append conversation history events for a session."""
+        pass
+    
+    @abstractmethod
+    async def get_conversation_context(self, session_id: str, max_turns: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recent user inputs and AI responses, oldest first."""
+        pass
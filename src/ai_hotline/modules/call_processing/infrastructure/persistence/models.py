@@ -1,17 +1,22 @@
 """SQLAlchemy models for call processing module."""
 
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, Text, JSON, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, ARRAY
+from sqlalchemy import BigInteger, Column, String, DateTime, Identity, Integer, Float, Boolean, Text, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, ARRAY, JSONB
 from sqlalchemy.orm import relationship
 
 from src.ai_hotline.shared.database.models import TenantBaseModel
+from src.ai_hotline.shared.database.session import Base
 
 
 class CallModel(TenantBaseModel):
     """SQLAlchemy model for Call entity."""
     
     __tablename__ = "calls"
+    __table_args__ = (
+        # Active-call dashboards filter by tenant and status
+        Index("ix_calls_tenant_status", "tenant_id", "status"),
+    )
     
     # Call identification
     phone_number = Column(String(20), nullable=False, index=True)
@@ -27,22 +32,22 @@ class CallModel(TenantBaseModel):
     
     # Session data
     session_id = Column(String(100), nullable=True, index=True)
-    audio_file_paths = Column(ARRAY(String), nullable=False, default=[])
+    audio_file_paths = Column(ARRAY(String), nullable=False, default=list, server_default="{}")
     
     # Content
-    transcript_segments = Column(JSON, nullable=False, default=[])
-    llm_responses = Column(JSON, nullable=False, default=[])
-    error_messages = Column(ARRAY(String), nullable=False, default=[])
+    transcript_segments = Column(JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb"))
+    llm_responses = Column(JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb"))
+    error_messages = Column(ARRAY(String), nullable=False, default=list, server_default="{}")
     
     # Business context
-    context_data = Column(JSON, nullable=False, default={})
-    automation_triggered = Column(ARRAY(String), nullable=False, default=[])
+    context_data = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
+    automation_triggered = Column(ARRAY(String), nullable=False, default=list, server_default="{}")
       # Quality metrics
     satisfaction_score = Column(Float, nullable=True)
     resolution_achieved = Column(Boolean, nullable=True)
     
     # Additional metadata
-    call_metadata = Column(JSON, nullable=False, default={})
+    call_metadata = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
     
     # Relationships
     sessions = relationship("CallSessionModel", back_populates="call", cascade="all, delete-orphan")
@@ -55,6 +60,16 @@ class CallSessionModel(TenantBaseModel):
     """SQLAlchemy model for CallSession entity."""
     
     __tablename__ = "call_sessions"
+    __table_args__ = (
+        # Idle-session sweeps only look at sessions that are still running
+        Index(
+            "ix_call_sessions_tenant_active",
+            "tenant_id",
+            "last_activity_at",
+            postgresql_where=text("state NOT IN ('ended', 'error')"),
+        ),
+        Index("ix_call_sessions_tenant_state", "tenant_id", "state"),
+    )
     
     # Session identification
     session_id = Column(String(100), nullable=False, unique=True, index=True)
@@ -73,16 +88,15 @@ class CallSessionModel(TenantBaseModel):
     is_recording = Column(Boolean, nullable=False, default=False)
     is_playing = Column(Boolean, nullable=False, default=False)
     
-    # Conversation context
-    conversation_history = Column(JSON, nullable=False, default=[])
+    # Conversation context (the full history lives in call_session_events)
     current_prompt = Column(Text, nullable=True)
     last_user_input = Column(Text, nullable=True)
     last_ai_response = Column(Text, nullable=True)
     
     # Processing state
-    pending_stt_requests = Column(ARRAY(String), nullable=False, default=[])
-    pending_llm_requests = Column(ARRAY(String), nullable=False, default=[])
-    pending_tts_requests = Column(ARRAY(String), nullable=False, default=[])
+    pending_stt_requests = Column(ARRAY(String), nullable=False, default=list, server_default="{}")
+    pending_llm_requests = Column(ARRAY(String), nullable=False, default=list, server_default="{}")
+    pending_tts_requests = Column(ARRAY(String), nullable=False, default=list, server_default="{}")
     
     # Configuration
     max_silence_duration_seconds = Column(Integer, nullable=False, default=10)
@@ -94,10 +108,46 @@ class CallSessionModel(TenantBaseModel):
     last_error = Column(Text, nullable=True)
     retry_count = Column(Integer, nullable=False, default=0)
       # Session metadata
-    session_metadata = Column(JSON, nullable=False, default={})
+    session_metadata = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
     
     # Relationships
     call = relationship("CallModel", back_populates="sessions")
+    events = relationship(
+        "CallSessionEventModel",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="noload",
+    )
     
     def __repr__(self):
         return f"<CallSessionModel(session_id={self.session_id}, state={self.state})>"
+
+
+class CallSessionEventModel(Base):
+    """Append-only conversation history entry for a call session.
+    
+    Each turn is its own row, so recording one does not rewrite the
+    session row or the history that came before it.
+    """
+    
+    __tablename__ = "call_session_events"
+    __table_args__ = (
+        Index("ix_call_session_events_ts", "ts", postgresql_using="brin"),
+    )
+    
+    session_id = Column(
+        String(100),
+        ForeignKey("call_sessions.session_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    seq = Column(BigInteger, Identity(), primary_key=True)
+    ts = Column(DateTime(timezone=True), nullable=False)
+    type = Column(String(30), nullable=False)
+    payload = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
+    
+    # Relationships
+    session = relationship("CallSessionModel", back_populates="events")
+    
+    def __repr__(self):
+        return f"<CallSessionEventModel(session_id={self.session_id}, seq={self.seq}, type={self.type})>"
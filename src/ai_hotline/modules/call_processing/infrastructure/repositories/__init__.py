@@ -0,0 +1 @@
+"""Call processing infrastructure repositories."""
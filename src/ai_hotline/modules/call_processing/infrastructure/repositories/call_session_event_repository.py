@@ -0,0 +1,69 @@
+"""SQLAlchemy implementation of call session event repository."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.ai_hotline.shared.exceptions import DatabaseError
+from src.ai_hotline.modules.call_processing.domain.entities.call_session import HistoryEvent
+from src.ai_hotline.modules.call_processing.domain.repositories import ICallSessionEventRepository
+from ..persistence.models import CallSessionEventModel
+
+DIALOG_EVENT_TYPES = ("user_input", "ai_response")
+
+
+class SqlAlchemyCallSessionEventRepository(ICallSessionEventRepository):
+    """SQLAlchemy implementation of call session event repository."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def add_events(self, session_id: str, events: Sequence[HistoryEvent]) -> int:
+        """Append conversation history events for a session in one INSERT."""
+        if not events:
+            return 0
+        
+        rows = []
+        for event in events:
+            payload = event.as_dict()
+            del payload["type"], payload["timestamp"]
+            rows.append({
+                "session_id": session_id,
+                "ts": datetime.fromtimestamp(event.timestamp, tz=timezone.utc),
+                "type": event.type,
+                "payload": payload,
+            })
+        
+        try:
+            await self.session.execute(insert(CallSessionEventModel), rows)
+            await self.session.commit()
+            return len(rows)
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to add call session events: {e}")
+    
+    async def get_conversation_context(self, session_id: str, max_turns: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recent user inputs and AI responses, oldest first."""
+        try:
+            rows = (await self.session.execute(
+                select(
+                    CallSessionEventModel.type,
+                    CallSessionEventModel.ts,
+                    CallSessionEventModel.payload,
+                )
+                .where(
+                    CallSessionEventModel.session_id == session_id,
+                    CallSessionEventModel.type.in_(DIALOG_EVENT_TYPES),
+                )
+                .order_by(CallSessionEventModel.seq.desc())
+                .limit(max_turns)
+            )).all()
+        except Exception as e:
+            raise DatabaseError(f"Failed to get conversation context: {e}")
+        
+        return [
+            {"type": row.type, "timestamp": row.ts.timestamp(), **row.payload}
+            for row in reversed(rows)
+        ]
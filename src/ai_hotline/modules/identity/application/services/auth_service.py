@@ -1,29 +1,190 @@
-"""Authentication service for identity module."""
+"""
+Authentication service for identity module.
 
-from datetime import datetime
-from typing import Optional, Tuple
+Users resolved from access tokens are cached in-process for up to
+``TOKEN_USER_CACHE_TTL_SECONDS``. Writes through ``CachingUserRepository``
+invalidate the entries of the current worker, but other workers keep serving
+their cached copy (e.g. of a user who was just suspended or locked) until it
+expires.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncContextManager, Callable, Coroutine, Optional, Set, Tuple, TypeVar
 from pydantic import EmailStr
 from uuid import UUID
+import asyncio
+import copy
+import hashlib
 import logging
+import os
+import secrets
+
+import redis.asyncio as redis
+from jose import JWTError
 
-from src.ai_hotline.shared.security.auth import token_manager, password_manager
+from src.ai_hotline.shared.cache import TTLCache
+from src.ai_hotline.shared.config import get_settings
+from src.ai_hotline.shared.security.auth import TokenData, token_manager, password_manager
 from src.ai_hotline.shared.exceptions import (
     AuthenticationError,
+    DatabaseError,
+    EntityAlreadyExistsError,
     EntityNotFoundError,
-    BusinessRuleViolationError
+    BusinessRuleViolationError,
+    ValidationError
 )
 from src.ai_hotline.modules.identity.domain.entities.user import User, UserStatus, UserRole
 from src.ai_hotline.modules.identity.domain.entities.tenant import Tenant
 from src.ai_hotline.modules.identity.domain.repositories import IUserRepository, ITenantRepository
+from src.ai_hotline.modules.identity.domain.value_objects import Email
+
+
+# Single-role claim tuples, built once instead of a new list per token.
+_ROLE_CLAIMS = {role: (role.value,) for role in UserRole}
+
+# Users resolved from access tokens, reused for a short time across requests
+# to skip JWT verification and the user lookup. Entries never outlive the token
+# and are keyed by a digest so raw tokens are not kept in memory.
+TOKEN_USER_CACHE_TTL_SECONDS = 30
+_token_user_cache: TTLCache[User] = TTLCache(maxsize=50_000, ttl=TOKEN_USER_CACHE_TTL_SECONDS)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Get the token user cache key for an access token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_cached_token_users(user_id: UUID) -> None:
+    """Forget cached users for every access token belonging to a user."""
+    _token_user_cache.discard_where(lambda user: user.id == user_id)
+
+T = TypeVar("T")
+
+# bcrypt releases the GIL, so hashing scales with cores. A dedicated pool keeps
+# login bursts from starving the default executor used for other blocking work.
+_password_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+
+async def _run_password_work(func: Callable[..., T], *args: Any) -> T:
+    """Run a password hash or verify call on the password thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_password_pool, func, *args)
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _spawn_background(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine in the background without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Get a throwaway hash of an unguessable password, created on first use."""
+    return password_manager.hash_password(secrets.token_urlsafe(16))
+
+
+def _verify_unknown_user_password(password: str) -> bool:
+    """Spend the same bcrypt work as a real check so unknown emails can't be told apart by timing."""
+    # Uncached: every unknown email shares the dummy hash, so a cached result
+    # would make a password sprayed across emails fast for missing accounts only
+    return password_manager.verify_password(password, _dummy_password_hash(), use_cache=False)
 
 
 class AuthenticationService:
     """Service for user authentication operations."""
     
-    def __init__(self, user_repository: IUserRepository, tenant_repository: ITenantRepository):
+    FAILED_LOGIN_KEY_PREFIX = "failauth:"
+    
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        tenant_repository: ITenantRepository,
+        redis_client: Optional[redis.Redis] = None,
+        user_repository_scope: Optional[Callable[[], AsyncContextManager[IUserRepository]]] = None,
+    ):
         self.user_repository = user_repository
         self.tenant_repository = tenant_repository  
+        self.redis_client = redis_client
+        # Opens a user repository on its own session for background work
+        # that outlives the request; without it, such work is skipped
+        self.user_repository_scope = user_repository_scope
         self.logger = logging.getLogger(__name__)
+        
+        security = get_settings().security
+        self.max_login_attempts = security.max_login_attempts
+        self.lockout_duration_minutes = security.lockout_duration_minutes
+    
+    async def _record_failed_login(self, user: User) -> None:
+        """
+        Count a failed login, writing to the database only on lockout.
+        
+        Attempts are counted in Redis with a TTL of the lockout window. The
+        user row is locked once the threshold is reached. Without Redis (or
+        if it is unreachable) every attempt is persisted with a single
+        increment-and-lock UPDATE.
+        """
+        if self.redis_client is not None:
+            key = f"{self.FAILED_LOGIN_KEY_PREFIX}{user.id}"
+            try:
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.incr(key)
+                    pipe.expire(key, self.lockout_duration_minutes * 60)
+                    attempts, _ = await pipe.execute()
+            except redis.RedisError as e:
+                self.logger.warning("Failed login counter unavailable, persisting attempt: %s", e)
+            else:
+                if attempts >= self.max_login_attempts:
+                    # The Redis count already hit the limit, so lock on this failure
+                    result = await self.user_repository.record_login_result(
+                        user.id, False, max_attempts=1, lockout_minutes=self.lockout_duration_minutes
+                    )
+                    if result is not None:
+                        user.locked_until = result.locked_until
+                    user.failed_login_attempts = attempts
+                    await self._clear_failed_logins(user)
+                return
+        
+        result = await self.user_repository.record_login_result(
+            user.id,
+            False,
+            max_attempts=self.max_login_attempts,
+            lockout_minutes=self.lockout_duration_minutes,
+        )
+        if result is not None:
+            user.failed_login_attempts = result.failed_login_attempts
+            user.locked_until = result.locked_until
+    
+    async def _clear_failed_logins(self, user: User) -> None:
+        """Reset the Redis failed login counter for a user."""
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.delete(f"{self.FAILED_LOGIN_KEY_PREFIX}{user.id}")
+        except redis.RedisError as e:
+            self.logger.warning("Failed to reset failed login counter: %s", e)
+    
+    def _issue_tokens(self, user: User) -> Tuple[str, str]:
+        """Create an access and refresh token pair for a newly registered user."""
+        access_token = token_manager.create_access_token(
+            user_id=str(user.id),
+            username=user.username,
+            tenant_id=user.tenant_id,
+            email=user.email,
+            roles=_ROLE_CLAIMS[user.role],
+        )
+        refresh_token = token_manager.create_refresh_token(
+            user_id=str(user.id),
+            tenant_id=user.tenant_id
+        )
+        return access_token, refresh_token
     
     async def register_tenant_with_admin(
         self,
@@ -54,49 +215,50 @@ class AuthenticationService:
         # if current_user and current_user.role != UserRole.SUPER_ADMIN:
         #     raise BusinessRuleViolationError("Only super admins can create tenants")
 
+        # Check tenant name and admin email availability; both repositories
+        # share one AsyncSession, which can't run statements concurrently
+        existing_tenant = await self.tenant_repository.get_by_name(tenant_name)
+        existing_user = await self.user_repository.get_by_email(Email.normalize(admin_email))
+        if existing_tenant:
+            self.logger.warning("Tenant registration failed: tenant already exists with name %s", tenant_name)
+            raise BusinessRuleViolationError(f"Tenant with name '{tenant_name}' already exists")
+        
+        if existing_user:
+            self.logger.warning("Tenant registration failed: admin email already in use %s", admin_email)
+            raise BusinessRuleViolationError("Admin email is already in use")
+        
         try:
-            # Check if tenant already exists
-            existing_tenant = await self.tenant_repository.get_by_name(tenant_name)
-            if existing_tenant:
-                self.logger.warning(f"Tenant registration failed: tenant already exists with name {tenant_name}")
-                raise BusinessRuleViolationError(f"Tenant with name '{tenant_name}' already exists")
-    
-            # Check if admin email is already in use
-            existing_user = await self.user_repository.get_by_email(admin_email)
-            if existing_user:
-                self.logger.warning(f"Tenant registration failed: admin email already in use {admin_email}")
-                raise BusinessRuleViolationError("Admin email is already in use")
-    
-            # Create tenant
+            # Hash password only once the name and email are known to be free
+            password_hash = await _run_password_work(password_manager.hash_password, admin_password)
+            
             tenant = Tenant(
                 name=tenant_name,
                 display_name=tenant_display_name,
                 contact_email=admin_email,
             )
-            created_tenant = await self.tenant_repository.create(tenant)
+            admin = User(
+                email=admin_email,
+                password_hash=password_hash,
+                username=admin_username,
+                role=UserRole.TENANT_ADMIN,
+                tenant_id=tenant.id,
+                last_login_at=datetime.utcnow()
+            )
             
-            try:
-                # Create admin user
-                user, access_token, refresh_token = await self.register_tenant_user(
-                    email=admin_email,
-                    password=admin_password,
-                    username=admin_username,
-                    role=UserRole.TENANT_ADMIN,
-                    tenant_id=created_tenant.id
-                )
-                
-                self.logger.info(f"Successfully created tenant '{tenant_name}' with admin user")
-                return created_tenant, user, access_token, refresh_token
-                
-            except Exception as user_error:
-                # If user creation fails, clean up the tenant
-                self.logger.error(f"Failed to create admin user, cleaning up tenant: {str(user_error)}")
-                await self.tenant_repository.delete(created_tenant.id)
-                raise BusinessRuleViolationError("Failed to create tenant admin user") from user_error
-                
-        except Exception as e:
-            self.logger.error(f"Tenant registration failed: {str(e)}")
+            # Both rows are written in one transaction, so a failed admin
+            # insert leaves no orphan tenant behind
+            created_tenant, user = await self.tenant_repository.create_with_admin(tenant, admin)
+        except EntityAlreadyExistsError as e:
+            # Lost a race with a concurrent registration for the same name or email
+            self.logger.warning("Tenant registration failed: tenant %s or admin email %s already exists", tenant_name, admin_email)
+            raise BusinessRuleViolationError("Tenant or admin email already exists") from e
+        except (DatabaseError, ValidationError) as e:
+            self.logger.error("Tenant registration failed: %s", e)
             raise BusinessRuleViolationError("Failed to register tenant and admin") from e
+        
+        access_token, refresh_token = self._issue_tokens(user)
+        self.logger.info("Successfully created tenant '%s' with admin user", tenant_name)
+        return created_tenant, user, access_token, refresh_token
 
 
     async def register_tenant_user(
@@ -105,7 +267,7 @@ class AuthenticationService:
         password: str,
         username: Optional[str] = None,
         role: UserRole = UserRole.VIEWER,
-        tenant_id: Optional[UUID] = None
+        tenant_id: Optional[UUID] = None,
     ) -> Tuple[User, str, str]:
         """
         Register a new user with email and password.
@@ -123,15 +285,15 @@ class AuthenticationService:
         Raises:
             BusinessRuleViolationError: If user already exists
         """
+        # Check if user already exists
+        existing_user = await self.user_repository.get_by_email(Email.normalize(email))
+        if existing_user:
+            self.logger.warning("User registration failed: user already exists for email %s", email)
+            raise BusinessRuleViolationError("User already exists")
+        
         try:
-            # Check if user already exists
-            existing_user = await self.user_repository.get_by_email(email.__str__())
-            if existing_user:
-                self.logger.warning(f"User registration failed: user already exists for email {email.__str__()}")
-                raise BusinessRuleViolationError("User already exists")
-            
-            # Hash password
-            password_hash = password_manager.hash_password(password)
+            # Hash password only once the email is known to be free
+            password_hash = await _run_password_work(password_manager.hash_password, password)
             
             # Create new user entity
             user = User(
@@ -145,26 +307,17 @@ class AuthenticationService:
             
             # Save user to repository
             await self.user_repository.create(user)
-            
-            # Generate tokens
-            access_token = token_manager.create_access_token(
-                user_id=str(user.id),
-                username=user.username,
-                tenant_id=user.tenant_id,
-                email=user.email,
-                roles=[role],
-            )
-
-            refresh_token = token_manager.create_refresh_token(
-                user_id=str(user.id),
-                tenant_id=user.tenant_id
-            )
-            
-            self.logger.info(f"User registered successfully: {user.id}")
-            return user, access_token, refresh_token
-        except Exception as e:
-            self.logger.error(f"User registration failed: {e}")
-            raise BusinessRuleViolationError("Failed to register user")
+        except EntityAlreadyExistsError as e:
+            # Lost a race with a concurrent registration for the same email
+            self.logger.warning("User registration failed: user already exists for email %s", email)
+            raise BusinessRuleViolationError("User already exists") from e
+        except (DatabaseError, ValidationError) as e:
+            self.logger.error("User registration failed: %s", e)
+            raise BusinessRuleViolationError("Failed to register user") from e
+        
+        access_token, refresh_token = self._issue_tokens(user)
+        self.logger.info("User registered successfully: %s", user.id)
+        return user, access_token, refresh_token
     
     async def authenticate_user(
         self, 
@@ -185,37 +338,39 @@ class AuthenticationService:
             AuthenticationError: If authentication fails
         """
         # Get user by email
-        user = await self.user_repository.get_by_email(email)
+        user = await self.user_repository.get_by_email(Email.normalize(email))
         if not user:
-            self.logger.warning(f"Authentication failed: user not found for email {email}")
+            await _run_password_work(_verify_unknown_user_password, password)
+            self.logger.warning("Authentication failed: user not found for email %s", email)
             raise AuthenticationError("Invalid email or password")
         
         # Check if account is locked
         if user.is_locked:
-            self.logger.warning(f"Authentication failed: account locked for user {user.id}")
+            self.logger.warning("Authentication failed: account locked for user %s", user.id)
             raise AuthenticationError("Account is temporarily locked")
         
         # # Check if account is active
         # if not user.is_active_user:
-        #     self.logger.warning(f"Authentication failed: inactive account for user {user.id}")
+        #     self.logger.warning("Authentication failed: inactive account for user %s", user.id)
         #     raise AuthenticationError("Account is not active")
         
         # Verify password
-        if not password_manager.verify_password(password, user.password_hash):
+        if not await _run_password_work(password_manager.verify_password, password, user.password_hash):
             # Record failed login attempt
-            user.record_failed_login()
-            await self.user_repository.update(user)
+            await self._record_failed_login(user)
             
-            self.logger.warning(f"Authentication failed: invalid password for user {user.id}")
+            self.logger.warning("Authentication failed: invalid password for user %s", user.id)
             raise AuthenticationError("Invalid email or password")
         
-        # # Check if password needs update
-        # if password_manager.needs_update(user.password_hash):
-        #     self.logger.info(f"Password hash needs update for user {user.id}")
-        
-        # Record successful login
+        # Record successful login (single UPDATE, no re-read of the row). No
+        # row back means the account was locked after the user was read.
+        result = await self.user_repository.record_login_result(user.id, True)
+        if result is None:
+            self.logger.warning("Authentication failed: account locked for user %s", user.id)
+            raise AuthenticationError("Account is temporarily locked")
         user.record_login()
-        await self.user_repository.update(user)
+        user.last_login_at = result.last_login_at
+        await self._clear_failed_logins(user)
         
         # Generate tokens
         access_token = token_manager.create_access_token(
@@ -223,7 +378,7 @@ class AuthenticationService:
             username=user.username,
             tenant_id=user.tenant_id,
             email=user.email,
-            roles=[user.role],
+            roles=_ROLE_CLAIMS[user.role],
         )
         
         refresh_token = token_manager.create_refresh_token(
@@ -231,9 +386,30 @@ class AuthenticationService:
             tenant_id=user.tenant_id
         )
         
-        self.logger.info(f"User authenticated successfully: {user.id}")
+        # Rehash with the current cost off the login path; the check itself
+        # is a cheap string parse, so only stale hashes spawn a task
+        if self.user_repository_scope is not None and password_manager.needs_update(user.password_hash):
+            _spawn_background(self._upgrade_password_hash(user.id, user.password_hash, password))
+        
+        self.logger.info("User authenticated successfully: %s", user.id)
         return user, access_token, refresh_token
     
+    async def _upgrade_password_hash(self, user_id: UUID, old_hash: str, password: str) -> None:
+        """
+        Rehash a password with the current parameters after a successful login.
+        
+        Runs after the request has finished, so it uses its own session and
+        writes only the hash, and only if nobody changed it in the meantime.
+        """
+        try:
+            new_hash = await _run_password_work(password_manager.hash_password, password)
+            async with self.user_repository_scope() as user_repository:
+                upgraded = await user_repository.replace_password_hash(user_id, old_hash, new_hash)
+            if upgraded:
+                self.logger.debug("Password hash upgraded for user %s", user_id)
+        except Exception as e:
+            self.logger.warning("Password hash upgrade failed for user %s: %s", user_id, e)
+    
     async def refresh_access_token(self, refresh_token: str) -> str:
         """
         Generate new access token from refresh token.
@@ -248,40 +424,59 @@ class AuthenticationService:
             AuthenticationError: If refresh token is invalid
         """
         try:
-            # Verify refresh token
-            payload = token_manager.verify_token(refresh_token)
-            
-            # Check token type
-            if payload.get("type") != "refresh":
-                raise AuthenticationError("Invalid token type")
-            
+            payload = token_manager.decode_token(refresh_token)
+            token_type = payload.get("type")
             user_id = UUID(payload["sub"])
+        except (JWTError, KeyError, ValueError, TypeError) as e:
+            self.logger.warning("Token refresh failed: %s", e)
+            raise AuthenticationError("Invalid refresh token") from None
+        
+        if token_type != "refresh":
+            raise AuthenticationError("Invalid token type")
+        
+        # Get user to ensure they still exist and are active
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
+            raise AuthenticationError("User not found")
+        
+        if not user.is_active_user:
+            raise AuthenticationError("User account is not active")
+        
+        # Generate new access token
+        access_token = token_manager.create_access_token(
+            user_id=str(user.id),
+            username=user.username,
+            tenant_id=user.tenant_id,
+            email=user.email,
+            roles=_ROLE_CLAIMS[user.role],
+        )
+        
+        self.logger.info("Access token refreshed for user: %s", user.id)
+        return access_token
+    
+    async def verify_token_claims(self, token: str) -> TokenData:
+        """
+        Verify an access token and return its claims without loading the user.
+        
+        Use this for handlers that only need the identity, tenant or roles
+        carried by the token. No database lookup is made, so a user that was
+        deactivated or had its role changed keeps the old claims until the
+        token expires (``access_token_expire_minutes``). Handlers that must
+        see the current account state should use ``verify_token_and_get_user``.
+        
+        Args:
+            token: Access token to verify
             
-            # Get user to ensure they still exist and are active
-            user = await self.user_repository.get_by_id(user_id)
-            if not user:
-                raise AuthenticationError("User not found")
-            
-            if not user.is_active_user:
-                raise AuthenticationError("User account is not active")
-            
-            # Generate new access token
-            access_token = token_manager.create_access_token(
-                subject=str(user.id),
-                tenant_id=user.tenant_id,
-                additional_claims={
-                    "role": user.role,
-                    "email": user.email,
-                    "username": user.username
-                }
-            )
-            
-            self.logger.info(f"Access token refreshed for user: {user.id}")
-            return access_token
+        Returns:
+            Claims carried by the token
             
-        except Exception as e:
-            self.logger.warning(f"Token refresh failed: {e}")
-            raise AuthenticationError("Invalid refresh token")
+        Raises:
+            AuthenticationError: If token is invalid or expired
+        """
+        token_data = token_manager.verify_token(token)
+        if token_data is None:
+            raise AuthenticationError("Invalid token")
+        return token_data
     
     async def verify_token_and_get_user(self, token: str) -> User:
         """
@@ -296,29 +491,41 @@ class AuthenticationService:
         Raises:
             AuthenticationError: If token is invalid or user not found
         """
-        try:
-            # Verify token
-            payload = token_manager.verify_token(token)
-            
-            # Check token type
-            if payload.get("type") != "access":
-                raise AuthenticationError("Invalid token type")
-            
-            user_id = UUID(payload["sub"])
-            
-            # Get user
-            user = await self.user_repository.get_by_id(user_id)
-            if not user:
-                raise AuthenticationError("User not found")
-            
-            if not user.is_active_user:
-                raise AuthenticationError("User account is not active")
-            
-            return user
-            
-        except Exception as e:
-            self.logger.warning(f"Token verification failed: {e}")
+        cache_key = _token_cache_key(token)
+        cached_user = _token_user_cache.get(cache_key)
+        if cached_user is not None:
+            # Hand out a copy so callers cannot mutate the cached entity
+            return copy.copy(cached_user)
+        
+        # Verify token (only valid access tokens are returned)
+        token_data = token_manager.verify_token(token)
+        if token_data is None:
             raise AuthenticationError("Invalid token")
+        
+        # Get user
+        user = await self.user_repository.get_by_id(token_data.user_id)
+        if not user:
+            raise AuthenticationError("User not found")
+        
+        if not user.is_active_user:
+            raise AuthenticationError("User account is not active")
+        
+        ttl = min(
+            TOKEN_USER_CACHE_TTL_SECONDS,
+            (token_data.exp - datetime.now(timezone.utc)).total_seconds(),
+        )
+        if ttl > 0:
+            _token_user_cache.set(cache_key, copy.copy(user), ttl=ttl)
+        
+        return user
+    
+    def invalidate_token(self, token: str) -> None:
+        """Forget the cached user for an access token (e.g. on logout)."""
+        _token_user_cache.pop(_token_cache_key(token))
+    
+    def invalidate_user_tokens(self, user_id: UUID) -> None:
+        """Forget cached users for every access token belonging to a user."""
+        invalidate_cached_token_users(user_id)
     
     async def change_password(
         self,
@@ -344,16 +551,17 @@ class AuthenticationService:
             raise EntityNotFoundError("User not found")
         
         # Verify current password
-        if not password_manager.verify_password(current_password, user.password_hash):
+        if not await _run_password_work(password_manager.verify_password, current_password, user.password_hash):
             raise AuthenticationError("Current password is incorrect")
         
         # Hash new password and update
-        new_password_hash = password_manager.hash_password(new_password)
+        new_password_hash = await _run_password_work(password_manager.hash_password, new_password)
         user.change_password(new_password_hash)
         
         await self.user_repository.update(user)
         
-        self.logger.info(f"Password changed for user: {user.id}")
+        self.invalidate_user_tokens(user.id)
+        self.logger.info("Password changed for user: %s", user.id)
     
     async def reset_password(self, email: str, new_password: str) -> None:
         """
@@ -367,17 +575,18 @@ class AuthenticationService:
             EntityNotFoundError: If user not found
         """
         # Get user by email
-        user = await self.user_repository.get_by_email(email)
+        user = await self.user_repository.get_by_email(Email.normalize(email))
         if not user:
             raise EntityNotFoundError("User not found")
         
         # Hash new password and update
-        new_password_hash = password_manager.hash_password(new_password)
+        new_password_hash = await _run_password_work(password_manager.hash_password, new_password)
         user.change_password(new_password_hash)
         
         await self.user_repository.update(user)
         
-        self.logger.info(f"Password reset for user: {user.id}")
+        self.invalidate_user_tokens(user.id)
+        self.logger.info("Password reset for user: %s", user.id)
     
     async def unlock_user_account(self, user_id: UUID) -> None:
         """
@@ -395,5 +604,6 @@ class AuthenticationService:
         
         user.unlock_account()
         await self.user_repository.update(user)
+        self.invalidate_user_tokens(user.id)
         
-        self.logger.info(f"Account unlocked for user: {user.id}")
+        self.logger.info("Account unlocked for user: %s", user.id)
@@ -1,12 +1,14 @@
 """Tenant domain entity."""
 
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, EmailStr
 from enum import Enum
 
 from src.ai_hotline.shared.exceptions import BusinessRuleViolationError
+from ..value_objects import Email
 
 
 class TenantStatus(str, Enum):
@@ -17,7 +19,33 @@ class TenantStatus(str, Enum):
     EXPIRED = "expired"
 
 
-class Tenant(BaseModel):
+# Canonical members keyed by value; loaded strings map to singletons with one dict lookup
+_STATUSES_BY_VALUE: Dict[str, TenantStatus] = {status.value: status for status in TenantStatus}
+
+# Read-only defaults shared by every tenant until it changes one of them;
+# the first write replaces the shared mapping with a private dict.
+_DEFAULT_FEATURES: Mapping[str, Any] = MappingProxyType({
+    "stt_enabled": True,
+    "tts_enabled": True,
+    "llm_providers": ("openai",),
+    "knowledge_management": True,
+    "automation": False,
+    "analytics": True,
+    "api_access": False
+})
+
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    "default_language": "ar-EG",  # Egyptian Arabic
+    "default_voice": "arabic_female_1",
+    "call_timeout_seconds": 300,
+    "max_call_duration_minutes": 30,
+    "auto_transcription": True,
+    "data_retention_days": 365
+})
+
+
+@dataclass(slots=True, kw_only=True)
+class Tenant:
     """
     Tenant entity for multi-tenancy support.
     
@@ -29,9 +57,9 @@ class Tenant(BaseModel):
     """
     
     # Identity
-    id: UUID = Field(default_factory=uuid4)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
     
     # Basic info
     name: str
@@ -39,7 +67,7 @@ class Tenant(BaseModel):
     description: Optional[str] = None
     
     # Contact info
-    contact_email: EmailStr
+    contact_email: str
     contact_phone: Optional[str] = None
     
     # Status and limits
@@ -49,105 +77,80 @@ class Tenant(BaseModel):
     max_storage_mb: int = 1000
     
     # Features and settings
-    features: Dict[str, Any] = Field(
-        default_factory=lambda: {
-            "stt_enabled": True,
-            "tts_enabled": True,
-            "llm_providers": ["openai"],
-            "knowledge_management": True,
-            "automation": False,
-            "analytics": True,
-            "api_access": False
-        }
-    )
-    settings: Dict[str, Any] = Field(
-        default_factory=lambda: {
-            "default_language": "ar-EG",
-            "default_voice": "arabic_female_1",
-            "call_timeout_seconds": 300,
-            "max_call_duration_minutes": 30,
-            "auto_transcription": True,
-            "data_retention_days": 365
-        }
-    )
+    features: Mapping[str, Any] = field(default_factory=lambda: _DEFAULT_FEATURES)
+    settings: Mapping[str, Any] = field(default_factory=lambda: _DEFAULT_SETTINGS)
     
     # Trial info
     trial_ends_at: Optional[datetime] = None
     
-    class Config:
-        use_enum_values = True
-
-    
-    def __init__(self, name: str, display_name: str, contact_email: str, **kwargs):
-        """Initialize tenant with required fields."""
-        super().__init__(
-            name=name,
-            display_name=display_name,
-            contact_email=contact_email,
-            **kwargs
-        )
+    def __post_init__(self) -> None:
+        """Validate the contact email, coerce the status to an enum member and fill default features/settings."""
+        Email(self.contact_email)
+        self.status = _STATUSES_BY_VALUE.get(self.status) or TenantStatus(self.status)
         
-        # Set default features if not provided
         if not self.features:
-            self.features = {
-                "stt_enabled": True,
-                "tts_enabled": True,
-                "llm_providers": ["openai"],
-                "knowledge_management": True,
-                "automation": False,
-                "analytics": True,
-                "api_access": False
-            }
-        
-        # Set default settings if not provided
+            self.features = _DEFAULT_FEATURES
         if not self.settings:
-            self.settings = {
-                "default_language": "ar-EG",  # Egyptian Arabic
-                "default_voice": "arabic_female_1",
-                "call_timeout_seconds": 300,
-                "max_call_duration_minutes": 30,                "auto_transcription": True,
-                "data_retention_days": 365
-            }
+            self.settings = _DEFAULT_SETTINGS
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary of plain field values."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["features"] = dict(self.features)
+        data["settings"] = dict(self.settings)
+        return data
+    
+    def _writable_features(self) -> Dict[str, Any]:
+        """Get the features as a private dict, copying the shared defaults on first write."""
+        if not isinstance(self.features, dict):
+            self.features = dict(self.features)
+        return self.features
+    
+    def _writable_settings(self) -> Dict[str, Any]:
+        """Get the settings as a private dict, copying the shared defaults on first write."""
+        if not isinstance(self.settings, dict):
+            self.settings = dict(self.settings)
+        return self.settings
 
     @property
     def is_active_tenant(self) -> bool:
         """Check if tenant is active."""
-        return self.status == TenantStatus.ACTIVE.value
+        return self.status is TenantStatus.ACTIVE
     
     @property
     def is_trial(self) -> bool:
         """Check if tenant is on trial."""
-        return self.status == TenantStatus.TRIAL.value
+        return self.status is TenantStatus.TRIAL
     
     @property
     def is_suspended(self) -> bool:
         """Check if tenant is suspended."""
-        return self.status == TenantStatus.SUSPENDED.value
+        return self.status is TenantStatus.SUSPENDED
     
     def activate(self) -> None:
         """Activate tenant."""
-        if self.status == TenantStatus.EXPIRED.value:
+        if self.status is TenantStatus.EXPIRED:
             raise BusinessRuleViolationError("Cannot activate expired tenant")
         
-        self.status = TenantStatus.ACTIVE.value
+        self.status = TenantStatus.ACTIVE
     
     def suspend(self) -> None:
         """Suspend tenant."""
-        self.status = TenantStatus.SUSPENDED.value
+        self.status = TenantStatus.SUSPENDED
     
     def expire_trial(self) -> None:
         """Mark trial as expired."""
         if not self.is_trial:
             raise BusinessRuleViolationError("Cannot expire non-trial tenant")
         
-        self.status = TenantStatus.EXPIRED.value
+        self.status = TenantStatus.EXPIRED
 
     def upgrade_from_trial(self) -> None:
         """Upgrade from trial to active."""
         if not self.is_trial:
             raise BusinessRuleViolationError("Can only upgrade trial tenants")
         
-        self.status = TenantStatus.ACTIVE.value
+        self.status = TenantStatus.ACTIVE
         self.trial_ends_at = None
     
     def update_limits(
@@ -174,17 +177,11 @@ class Tenant(BaseModel):
     
     def enable_feature(self, feature_name: str) -> None:
         """Enable a feature for the tenant."""
-        if not self.features:
-            self.features = {}
-        
-        self.features[feature_name] = True
+        self._writable_features()[feature_name] = True
     
     def disable_feature(self, feature_name: str) -> None:
         """Disable a feature for the tenant."""
-        if not self.features:
-            self.features = {}
-        
-        self.features[feature_name] = False
+        self._writable_features()[feature_name] = False
     
     def has_feature(self, feature_name: str) -> bool:
         """Check if tenant has a specific feature enabled."""
@@ -195,10 +192,7 @@ class Tenant(BaseModel):
     
     def update_setting(self, setting_name: str, value: Any) -> None:
         """Update a tenant setting."""
-        if not self.settings:
-            self.settings = {}
-        
-        self.settings[setting_name] = value
+        self._writable_settings()[setting_name] = value
     
     def get_setting(self, setting_name: str, default: Any = None) -> Any:
         """Get a tenant setting value."""
@@ -223,4 +217,4 @@ class Tenant(BaseModel):
     
     def __str__(self) -> str:
         """String representation."""
-        return f"Tenant({self.name}, {self.status})"
+        return f"Tenant({self.name}, {self.status.value})"
@@ -1,12 +1,14 @@
 """User domain entity."""
 
-from datetime import datetime
-from typing import Optional, List
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, Optional
 from uuid import UUID, uuid4
 from enum import Enum
-from pydantic import BaseModel, Field, EmailStr
 
 from src.ai_hotline.shared.exceptions import BusinessRuleViolationError
+from ..value_objects import Email
 
 
 class UserRole(str, Enum):
@@ -25,7 +27,33 @@ class UserStatus(str, Enum):
     PENDING_VERIFICATION = "pending_verification"
 
 
-class User(BaseModel):
+_utcnow = datetime.utcnow
+
+# Canonical members keyed by value. Loading from the database maps each string
+# to its singleton with one dict lookup instead of an Enum call; members hash
+# and compare like their values, so they are found here as well.
+_ROLES_BY_VALUE: Dict[str, UserRole] = {role.value: role for role in UserRole}
+_STATUSES_BY_VALUE: Dict[str, UserStatus] = {status.value: status for status in UserStatus}
+
+_PERMISSIONS: Dict[UserRole, FrozenSet[str]] = {
+    UserRole.SUPER_ADMIN: frozenset({"*"}),  # All permissions
+    UserRole.TENANT_ADMIN: frozenset({
+        "users.create", "users.read", "users.update", "users.delete",
+        "calls.read", "calls.manage", "knowledge.manage", "automation.manage"
+    }),
+    UserRole.OPERATOR: frozenset({
+        "calls.read", "calls.create", "knowledge.read", "automation.execute"
+    }),
+    UserRole.VIEWER: frozenset({
+        "calls.read", "knowledge.read"
+    }),
+}
+_NO_PERMISSIONS: FrozenSet[str] = frozenset()
+_ALL_PERMISSION_ROLES = frozenset(role for role, perms in _PERMISSIONS.items() if "*" in perms)
+
+
+@dataclass(slots=True, kw_only=True)
+class User:
     """
     User entity representing system users.
     
@@ -37,15 +65,15 @@ class User(BaseModel):
     """
     
     # Identity
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = field(default_factory=uuid4)
     tenant_id: UUID
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
     
     # Basic info
-    email: EmailStr
+    email: str
     username: str
-    password_hash: str
+    password_hash: str = field(repr=False)
     first_name: str = ""
     last_name: str = ""
     is_active: bool = True
@@ -71,8 +99,18 @@ class User(BaseModel):
     language: str = "en"
     bio: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
+    def __post_init__(self) -> None:
+        """Validate the email, coerce role/status to enum members and intern locale strings."""
+        Email(self.email)
+        self.role = _ROLES_BY_VALUE.get(self.role) or UserRole(self.role)
+        self.status = _STATUSES_BY_VALUE.get(self.status) or UserStatus(self.status)
+        # Few distinct values across all users; share one string object each
+        self.timezone = sys.intern(self.timezone)
+        self.language = sys.intern(self.language)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary of plain field values."""
+        return asdict(self)
     
     @property
     def full_name(self) -> str:
@@ -82,18 +120,18 @@ class User(BaseModel):
     @property
     def is_active_user(self) -> bool:
         """Check if user is active."""
-        return self.status == UserStatus.ACTIVE.value
+        return self.status is UserStatus.ACTIVE
     
     @property
     def is_locked(self) -> bool:
         """Check if user account is locked."""
-        if self.locked_until is None:
-            return False
-        return datetime.utcnow() < self.locked_until
+        locked_until = self.locked_until
+        # Most accounts are not locked; skip reading the clock for them
+        return locked_until is not None and _utcnow() < locked_until
     
     def change_email(self, new_email: str) -> None:
         """Change user email and require re-verification."""
-        if self.status == UserStatus.SUSPENDED.value:
+        if self.status is UserStatus.SUSPENDED:
             raise BusinessRuleViolationError("Cannot change email for suspended user")
         
         self.email = new_email
@@ -101,7 +139,7 @@ class User(BaseModel):
     
     def change_password(self, new_password_hash: str) -> None:
         """Change user password and reset security flags."""
-        if self.status == UserStatus.SUSPENDED.value:
+        if self.status is UserStatus.SUSPENDED:
             raise BusinessRuleViolationError("Cannot change password for suspended user")
         
         self.password_hash = new_password_hash
@@ -110,32 +148,32 @@ class User(BaseModel):
     
     def change_role(self, new_role: UserRole) -> None:
         """Change user role."""
-        if self.status == UserStatus.SUSPENDED.value:
+        if self.status is UserStatus.SUSPENDED:
             raise BusinessRuleViolationError("Cannot change role for suspended user")
         
-        self.role = new_role.value
+        self.role = UserRole(new_role)
     
     def activate(self) -> None:
         """Activate user account."""
-        if self.status == UserStatus.SUSPENDED.value:
+        if self.status is UserStatus.SUSPENDED:
             raise BusinessRuleViolationError("Cannot activate suspended user")
         
-        self.status = UserStatus.ACTIVE.value
+        self.status = UserStatus.ACTIVE
     
     def deactivate(self) -> None:
         """Deactivate user account."""
-        self.status = UserStatus.INACTIVE.value
+        self.status = UserStatus.INACTIVE
     
     def suspend(self) -> None:
         """Suspend user account."""
-        self.status = UserStatus.SUSPENDED.value
+        self.status = UserStatus.SUSPENDED
     
     def verify_email(self) -> None:
         """Mark email as verified and auto-activate if pending."""
         self.email_verified = True
         
-        if self.status == UserStatus.PENDING_VERIFICATION.value:
-            self.status = UserStatus.ACTIVE.value
+        if self.status is UserStatus.PENDING_VERIFICATION:
+            self.status = UserStatus.ACTIVE
     
     def record_login(self) -> None:
         """Record successful login."""
@@ -148,9 +186,11 @@ class User(BaseModel):
         self.failed_login_attempts += 1
         
         if self.failed_login_attempts >= max_attempts:
-            self.locked_until = datetime.utcnow().replace(
-                minute=datetime.utcnow().minute + lockout_minutes
-            )
+            self.lock_account(lockout_minutes)
+    
+    def lock_account(self, lockout_minutes: int = 30) -> None:
+        """Lock user account for the given number of minutes."""
+        self.locked_until = datetime.utcnow() + timedelta(minutes=lockout_minutes)
     
     def unlock_account(self) -> None:
         """Unlock user account."""
@@ -160,7 +200,7 @@ class User(BaseModel):
     def can_access_tenant(self, tenant_id: UUID) -> bool:
         """Check if user can access a specific tenant."""
         # Super admins can access all tenants
-        if self.role == UserRole.SUPER_ADMIN.value:
+        if self.role is UserRole.SUPER_ADMIN:
             return True
         
         # Regular users can only access their own tenant
@@ -168,27 +208,11 @@ class User(BaseModel):
     
     def has_permission(self, permission: str) -> bool:
         """Check if user has a specific permission based on role."""
-        permissions = {
-            UserRole.SUPER_ADMIN.value: ["*"],  # All permissions
-            UserRole.TENANT_ADMIN.value: [
-                "users.create", "users.read", "users.update", "users.delete",
-                "calls.read", "calls.manage", "knowledge.manage", "automation.manage"
-            ],
-            UserRole.OPERATOR.value: [
-                "calls.read", "calls.create", "knowledge.read", "automation.execute"
-            ],
-            UserRole.VIEWER.value: [
-                "calls.read", "knowledge.read"
-            ]
-        }
-        
-        user_permissions = permissions.get(self.role, [])
-        
         # Super admin has all permissions
-        if "*" in user_permissions:
+        if self.role in _ALL_PERMISSION_ROLES:
             return True
         
-        return permission in user_permissions
+        return permission in _PERMISSIONS.get(self.role, _NO_PERMISSIONS)
     
     def __str__(self) -> str:
         """String representation."""
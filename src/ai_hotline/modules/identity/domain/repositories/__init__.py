@@ -1,13 +1,27 @@
 """Repository interfaces for identity domain."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Iterable, NamedTuple, Optional, List, Sequence, Tuple
 from uuid import UUID
 
 from ..entities.user import User
 from ..entities.tenant import Tenant
 
 
+# Upper bound on the page size of list queries
+MAX_PAGE_SIZE = 500
+
+
+
+class LoginState(NamedTuple):
+    """Login tracking fields of a user after a login attempt is recorded."""
+    
+    failed_login_attempts: int
+    locked_until: Optional[datetime]
+    last_login_at: Optional[datetime]
+
+
 class IUserRepository(ABC):
     """User repository interface."""
     
@@ -16,14 +30,35 @@ class IUserRepository(ABC):
         """Create a new user."""
         pass
     
+    @abstractmethod
+    async def create_many(self, users: Sequence[User]) -> int:
+        """Insert users in one batched statement; returns the number inserted."""
+        pass
+    
+    @abstractmethod
+    async def update_many(self, users: Sequence[User]) -> int:
+        """Update users by ID in one batched statement; returns the number given."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get users by ID in one query; missing users are left out."""
+        pass
+    
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
+        """
+        Get user by email.
+        
+        Callers should pass the ``Email.normalize`` form. Implementations
+        should match case-insensitively on an indexed column (the users table
+        stores email as CITEXT) instead of ``LOWER(email)``.
+        """
         pass
     
     @abstractmethod
@@ -46,9 +81,17 @@ class IUserRepository(ABC):
         self, 
         tenant_id: UUID, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        last_id: Optional[UUID] = None
     ) -> List[User]:
-        """List users in a tenant."""
+        """
+        List users in a tenant, ordered by ID.
+        
+        ``limit`` is clamped to ``[1, MAX_PAGE_SIZE]`` and ``skip`` must not be
+        negative. Pass the last ID of the previous page as ``last_id`` for
+        keyset pagination, which stays cheap at any depth; ``skip`` is then
+        applied after it.
+        """
         pass
     
     @abstractmethod
@@ -56,6 +99,16 @@ class IUserRepository(ABC):
         """Count users in a tenant."""
         pass
     
+    @abstractmethod
+    async def estimated_count_by_tenant(self, tenant_id: UUID) -> int:
+        """
+        Count users in a tenant, allowing a briefly stale result.
+        
+        Use this for pagination totals, where an exact count on every page
+        is not worth a query.
+        """
+        pass
+    
     @abstractmethod
     async def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
@@ -65,6 +118,35 @@ class IUserRepository(ABC):
     async def username_exists(self, username: str, tenant_id: UUID) -> bool:
         """Check if username exists in tenant."""
         pass
+    
+    @abstractmethod
+    async def record_login_result(
+        self,
+        user_id: UUID,
+        success: bool,
+        max_attempts: int = 5,
+        lockout_minutes: int = 30
+    ) -> Optional[LoginState]:
+        """
+        Record a login attempt in a single statement, without reading the user first.
+        
+        A success stamps ``last_login_at`` and clears the lockout state, unless
+        the account is currently locked; a failure increments the attempt
+        counter and locks the account for ``lockout_minutes`` once it reaches
+        ``max_attempts``. Returns the new login state, or None if the user
+        does not exist or a success was refused because of an active lock.
+        """
+        pass
+    
+    @abstractmethod
+    async def replace_password_hash(self, user_id: UUID, old_hash: str, new_hash: str) -> bool:
+        """
+        Swap a user's password hash only if it still equals ``old_hash``.
+        
+        Only the hash column is written, so concurrent changes to the rest of
+        the row are kept. Returns whether the hash was replaced.
+        """
+        pass
 
 
 class ITenantRepository(ABC):
@@ -75,11 +157,35 @@ class ITenantRepository(ABC):
         """Create a new tenant."""
         pass
     
+    @abstractmethod
+    async def create_with_admin(self, tenant: Tenant, admin: User) -> Tuple[Tenant, User]:
+        """
+        Create a tenant and its first admin user in one transaction.
+        
+        Neither row is kept if either insert fails.
+        """
+        pass
+    
+    @abstractmethod
+    async def create_many(self, tenants: Sequence[Tenant]) -> int:
+        """Insert tenants in one batched statement; returns the number inserted."""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
         """Get tenant by ID."""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, tenant_ids: Iterable[UUID]) -> Dict[UUID, Tenant]:
+        """
+        Get tenants by ID in one query; missing tenants are left out.
+        
+        Use this to resolve the tenants of a list of users instead of
+        loading each one separately.
+        """
+        pass
+    
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Tenant]:
         """Get tenant by name."""
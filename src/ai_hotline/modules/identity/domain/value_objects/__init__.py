@@ -6,6 +6,51 @@ from dataclasses import dataclass
 
 from src.ai_hotline.shared.exceptions import ValidationError
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_PHONE_RE = re.compile(r'^\+?[1-9]\d{7,14}$')
+_PHONE_STRIP = re.compile(r'[^\d+]')
+TENANT_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_.&()]+$')
+
+_PASSWORD_SPECIALS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+# Character class bit masks (upper=1, lower=2, digit=4, special=8) with at least 3 bits set
+_STRONG_PASSWORD_MASKS = frozenset(mask for mask in range(16) if bin(mask).count("1") >= 3)
+
+
+def is_strong_password(value: str) -> bool:
+    """Check in a single pass that a password mixes at least 3 character classes."""
+    flags = 0
+    for c in value:
+        if c.isupper():
+            flags |= 1
+        elif c.islower():
+            flags |= 2
+        elif c.isdigit():
+            flags |= 4
+        elif c in _PASSWORD_SPECIALS:
+            flags |= 8
+        else:
+            continue
+        if flags in _STRONG_PASSWORD_MASKS:
+            return True
+    return False
+
+
+def check_password_strength(value: str) -> str:
+    """
+    Validate password length and character mix for request validators.
+    
+    Raises ``ValueError`` (which Pydantic reports as a field error) rather
+    than ``ValidationError``; returns the password unchanged.
+    """
+    if len(value) < 8:
+        raise ValueError("Password must be at least 8 characters")
+    if not is_strong_password(value):
+        raise ValueError(
+            "Password must contain at least 3 of: uppercase, lowercase, digit, special character"
+        )
+    return value
+
 
 @dataclass(frozen=True)
 class Email:
@@ -19,11 +64,7 @@ class Email:
             raise ValidationError("Email cannot be empty")
         
         # Basic email validation
-        email_pattern = re.compile(
-            r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        )
-        
-        if not email_pattern.match(self.value):
+        if not _EMAIL_RE.match(self.value):
             raise ValidationError("Invalid email format")
         
         if len(self.value) > 255:
@@ -31,6 +72,11 @@ class Email:
     
     def __str__(self) -> str:
         return self.value
+    
+    @staticmethod
+    def normalize(raw: str) -> str:
+        """Get the lookup key for an email: trimmed and lowercased."""
+        return raw.strip().lower()
 
 
 @dataclass(frozen=True)
@@ -51,9 +97,7 @@ class Username:
             raise ValidationError("Username too long (max 50 characters)")
         
         # Allow alphanumeric, underscore, and dash
-        username_pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
-        
-        if not username_pattern.match(self.value):
+        if not USERNAME_RE.match(self.value):
             raise ValidationError(
                 "Username can only contain letters, numbers, underscore, and dash"
             )
@@ -79,15 +123,7 @@ class Password:
         if len(self.value) > 128:
             raise ValidationError("Password too long (max 128 characters)")
         
-        # Check for basic strength requirements
-        has_upper = any(c.isupper() for c in self.value)
-        has_lower = any(c.islower() for c in self.value)
-        has_digit = any(c.isdigit() for c in self.value)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in self.value)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
-        
-        if sum(strength_checks) < 3:
+        if not is_strong_password(self.value):
             raise ValidationError(
                 "Password must contain at least 3 of: uppercase, lowercase, digit, special character"
             )
@@ -108,13 +144,13 @@ class PhoneNumber:
             raise ValidationError("Phone number cannot be empty")
         
         # Remove common formatting
-        cleaned = re.sub(r'[^\d+]', '', self.value)
+        cleaned = _PHONE_STRIP.sub('', self.value)
         
         if not cleaned:
             raise ValidationError("Invalid phone number format")
         
         # Basic international format validation
-        if not re.match(r'^\+?[1-9]\d{7,14}$', cleaned):
+        if not _PHONE_RE.match(cleaned):
             raise ValidationError("Invalid phone number format")
         
         # Store the cleaned version
@@ -149,7 +185,7 @@ class TenantName:
             raise ValidationError("Tenant name too long (max 100 characters)")
         
         # Allow letters, numbers, spaces, and basic punctuation
-        if not re.match(r'^[a-zA-Z0-9\s\-_.&()]+$', self.value):
+        if not TENANT_NAME_RE.match(self.value):
             raise ValidationError(
                 "Tenant name contains invalid characters"
             )
@@ -1,8 +1,53 @@
 """Mappers package."""
 
-from .user_mapper import UserMapper, TenantMapper
+from .user_mapper import (
+    USER_COLUMNS,
+    TENANT_COLUMNS,
+    MappingContext,
+    UserMapper,
+    TenantMapper,
+    user_to_domain,
+    users_to_domain,
+    user_from_row,
+    users_from_rows,
+    user_to_model,
+    user_insert_values,
+    users_to_insert_dicts,
+    user_update_values,
+    users_to_update_dicts,
+    update_user_model,
+    tenant_to_domain,
+    tenants_to_domain,
+    tenant_from_row,
+    tenants_from_rows,
+    tenant_to_model,
+    tenant_insert_values,
+    tenants_to_insert_dicts,
+    update_tenant_model,
+)
 
 __all__ = [
+    "USER_COLUMNS",
+    "TENANT_COLUMNS",
+    "MappingContext",
     "UserMapper",
     "TenantMapper",
+    "user_to_domain",
+    "users_to_domain",
+    "user_from_row",
+    "users_from_rows",
+    "user_to_model",
+    "user_insert_values",
+    "users_to_insert_dicts",
+    "user_update_values",
+    "users_to_update_dicts",
+    "update_user_model",
+    "tenant_to_domain",
+    "tenants_to_domain",
+    "tenant_from_row",
+    "tenants_from_rows",
+    "tenant_to_model",
+    "tenant_insert_values",
+    "tenants_to_insert_dicts",
+    "update_tenant_model",
 ]
@@ -1,10 +1,11 @@
 """SQLAlchemy models for identity module."""
 
 from datetime import datetime
-from typing import Optional
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer, JSON
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
-from sqlalchemy.orm import relationship
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Text, Integer, text
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB, UUID as PostgresUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.ai_hotline.shared.database.models import BaseModel, TenantBaseModel
 
@@ -15,35 +16,42 @@ class TenantModel(BaseModel):
     __tablename__ = "tenants"
     
     # Identity
-    id = Column(PostgresUUID(as_uuid=True), primary_key=True, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    id: Mapped[UUID] = mapped_column(PostgresUUID(as_uuid=True), primary_key=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Basic info
-    name = Column(String(100), nullable=False, unique=True)
-    display_name = Column(String(200), nullable=False)
-    description = Column(Text, nullable=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    display_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Contact info
-    contact_email = Column(String(255), nullable=False)
-    contact_phone = Column(String(50), nullable=True)
-    
-    # Status and limits
-    status = Column(String(20), nullable=False, default="trial")
-    max_users = Column(Integer, nullable=False, default=5)
-    max_calls_per_month = Column(Integer, nullable=False, default=100)
-    max_storage_mb = Column(Integer, nullable=False, default=1000)
-    
-    # Features and settings
-    features = Column(JSON, nullable=False, default=dict)
-    settings = Column(JSON, nullable=False, default=dict)
+    contact_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    contact_phone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    
+    # Status and limits; constant defaults live in the DDL so unset
+    # columns are left out of the INSERT
+    status: Mapped[str] = mapped_column(String(20), nullable=False, server_default=text("'trial'"))
+    max_users: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("5"))
+    max_calls_per_month: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("100"))
+    max_storage_mb: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("1000"))
+    
+    # Features and settings; deferred so tenants loaded alongside users don't
+    # fetch them, repositories undefer the "config" group when mapping
+    features: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"),
+        deferred=True, deferred_group="config",
+    )
+    settings: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"),
+        deferred=True, deferred_group="config",
+    )
     
     # Trial info
-    trial_ends_at = Column(DateTime, nullable=True)
+    trial_ends_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
-    users = relationship(
-        "UserModel", 
+    users: Mapped[List["UserModel"]] = relationship(
         back_populates="tenant", 
         cascade="all, delete-orphan",
         lazy="select"
@@ -57,63 +65,75 @@ class UserModel(TenantBaseModel):
     """SQLAlchemy model for User entity."""
     
     __tablename__ = "users" 
+    __table_args__ = (
+        # Tenant reads only see active users: username lookups probe by
+        # (tenant_id, username) and keyset pages walk (tenant_id, id)
+        Index(
+            "ix_users_tenant_username_active",
+            "tenant_id",
+            "username",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_users_tenant_id_active",
+            "tenant_id",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
     
     # Basic info
-    email = Column(String(255), nullable=False, unique=True, index=True)
-    username = Column(String(50), nullable=False, index=True)
-    full_name = Column(String(200), nullable=False)
-    phone_number = Column(String(20), nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Case-insensitive so the unique index serves get_by_email for any casing
+    email: Mapped[str] = mapped_column(CITEXT(), nullable=False, unique=True, index=True)
+    username: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    phone_number: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     
-    # Authentication
-    password_hash = Column(String(255), nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_email_verified = Column(Boolean, default=False, nullable=False)
+    # Authentication; constant defaults below live in the DDL so unset
+    # columns are left out of the INSERT
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, server_default=text("true"), nullable=False)
+    is_email_verified: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
     
-    # Role and permissions
-    role = Column(String(50), nullable=False, default="OPERATOR")
-    
-    first_name = Column(String(100), nullable=False)
-    last_name = Column(String(100), nullable=False)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
     
     # Role and status
-    role = Column(String(20), nullable=False, default="viewer")
-    status = Column(String(20), nullable=False, default="pending_verification")
+    role: Mapped[str] = mapped_column(String(20), nullable=False, server_default=text("'viewer'"))
+    status: Mapped[str] = mapped_column(String(20), nullable=False, server_default=text("'pending_verification'"))
     
     # Verification flags
-    email_verified = Column(Boolean, default=False, nullable=False)
-    phone_verified = Column(Boolean, default=False, nullable=False)
+    email_verified: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
+    phone_verified: Mapped[bool] = mapped_column(Boolean, server_default=text("false"), nullable=False)
     
     # Security
-    failed_login_attempts = Column(Integer, default=0, nullable=False)
-    locked_until = Column(DateTime, nullable=True)
-    last_login_at = Column(DateTime, nullable=True)
-    password_changed_at = Column(DateTime, nullable=True)
+    failed_login_attempts: Mapped[int] = mapped_column(Integer, server_default=text("0"), nullable=False)
+    locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    password_changed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Profile
-    avatar_url = Column(String(500), nullable=True)
-    timezone = Column(String(50), default="UTC", nullable=False)
-    language = Column(String(10), default="en", nullable=False)
-    bio = Column(Text, nullable=True)
+    avatar_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    timezone: Mapped[str] = mapped_column(String(50), server_default=text("'UTC'"), nullable=False)
+    language: Mapped[str] = mapped_column(String(10), server_default=text("'en'"), nullable=False)
+    bio: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Relationships
     
     # Tenant relationship
-    tenant_id = Column(
+    tenant_id: Mapped[UUID] = mapped_column(
         PostgresUUID(as_uuid=True), 
         ForeignKey("tenants.id", ondelete="CASCADE"), 
         nullable=False,
         index=True
     )
-    tenant = relationship(
-        "TenantModel", 
+    # Loaded on access; callers that need tenants for many users should
+    # request them with selectinload(UserModel.tenant)
+    tenant: Mapped["TenantModel"] = relationship(
         back_populates="users",
-        lazy="joined"  # Eager loading for tenant
+        lazy="select"
     )
 
-    preferences = relationship(
-        "UserPreferencesModel", 
+    preferences: Mapped[Optional["UserPreferencesModel"]] = relationship(
         back_populates="user",
         uselist=False,  # One-to-one relationship
         cascade="all, delete-orphan",
@@ -0,0 +1,218 @@
+"""Caching decorator for the user repository."""
+
+import asyncio
+import copy
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from src.ai_hotline.shared.cache import TTLCache
+from src.ai_hotline.shared.config.settings import get_settings
+from src.ai_hotline.modules.identity.domain.entities.user import User
+from src.ai_hotline.modules.identity.domain.repositories import IUserRepository, LoginState
+from src.ai_hotline.modules.identity.domain.value_objects import Email
+
+_LOAD_FAILED = object()
+
+
+class UserLookupCache:
+    """
+    Process-wide LRU caches of users by ID and by normalized email.
+    
+    Entries also expire after ``ttl`` seconds so that changes made by other
+    workers become visible without explicit invalidation. Concurrent misses
+    for the same key share a single in-flight database load. Per-tenant user
+    counts are kept for the same TTL and are never invalidated early.
+    """
+    
+    def __init__(self, maxsize: int = 4096, ttl: float = 60):
+        self.by_id: TTLCache[User] = TTLCache(maxsize, ttl)
+        self.by_email: TTLCache[User] = TTLCache(maxsize, ttl)
+        self.tenant_counts: TTLCache[int] = TTLCache(maxsize, ttl)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+    
+    async def load(
+        self,
+        cache: TTLCache[User],
+        key: Hashable,
+        loader: Callable[[], Awaitable[Optional[User]]],
+    ) -> Optional[User]:
+        """Return a cached user or load it, coalescing concurrent misses."""
+        user = cache.get(key)
+        if user is not None:
+            return copy.copy(user)
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            user = await asyncio.shield(inflight)
+            if user is not _LOAD_FAILED:
+                return copy.copy(user) if user is not None else None
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            user = await loader()
+        except BaseException:
+            future.set_result(_LOAD_FAILED)
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        
+        # Don't store a row read before a concurrent write evicted it
+        if user is not None and generation == self._generation:
+            self.store(user)
+        future.set_result(user)
+        return copy.copy(user) if user is not None else None
+    
+    def store(self, user: User) -> None:
+        """Cache a user under both keys."""
+        self.by_id.set(user.id, user)
+        self.by_email.set(("email", Email.normalize(user.email)), user)
+    
+    def evict(self, user_id: UUID) -> None:
+        """Drop every cached entry for a user, including in-flight loads."""
+        self._generation += 1
+        self.by_id.pop(user_id)
+        self.by_email.discard_where(lambda user: user.id == user_id)
+    
+    def clear(self) -> None:
+        """Drop all cached users."""
+        self._generation += 1
+        self.by_id.clear()
+        self.by_email.clear()
+        self.tenant_counts.clear()
+
+
+@lru_cache()
+def get_user_lookup_cache() -> UserLookupCache:
+    """Get the process-wide user lookup cache."""
+    security = get_settings().security
+    return UserLookupCache(security.user_cache_maxsize, security.user_cache_ttl_seconds)
+
+
+class CachingUserRepository(IUserRepository):
+    """User repository decorator that serves ID and email lookups from a cache."""
+    
+    def __init__(
+        self,
+        inner: IUserRepository,
+        cache: Optional[UserLookupCache] = None,
+        on_user_changed: Optional[Callable[[UUID], None]] = None,
+    ):
+        self.inner = inner
+        self.cache = cache or get_user_lookup_cache()
+        # Called after writes that may change a user's status, role or lock,
+        # so caches kept outside this repository can drop the user too
+        self.on_user_changed = on_user_changed
+    
+    def _changed(self, user_id: UUID) -> None:
+        """Evict a user and notify ``on_user_changed``."""
+        self.cache.evict(user_id)
+        if self.on_user_changed is not None:
+            self.on_user_changed(user_id)
+    
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        return await self.inner.create(user)
+    
+    async def create_many(self, users: Sequence[User]) -> int:
+        """Insert users in one batched statement; returns the number inserted."""
+        return await self.inner.create_many(users)
+    
+    async def update_many(self, users: Sequence[User]) -> int:
+        """Update users in one batched statement and evict their cached entries."""
+        try:
+            return await self.inner.update_many(users)
+        finally:
+            for user in users:
+                self._changed(user.id)
+    
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        """Get user by ID."""
+        return await self.cache.load(
+            self.cache.by_id, user_id, lambda: self.inner.get_by_id(user_id)
+        )
+    
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get users by ID in one query; missing users are left out."""
+        return await self.inner.get_by_ids(user_ids)
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        return await self.cache.load(
+            self.cache.by_email, ("email", Email.normalize(email)), lambda: self.inner.get_by_email(email)
+        )
+    
+    async def get_by_username(self, username: str, tenant_id: UUID) -> Optional[User]:
+        """Get user by username within a tenant."""
+        return await self.inner.get_by_username(username, tenant_id)
+    
+    async def update(self, user: User) -> User:
+        """Update user and evict its cached entries."""
+        try:
+            return await self.inner.update(user)
+        finally:
+            self._changed(user.id)
+    
+    async def delete(self, user_id: UUID) -> bool:
+        """Delete user and evict its cached entries."""
+        try:
+            return await self.inner.delete(user_id)
+        finally:
+            self._changed(user_id)
+    
+    async def list_by_tenant(
+        self,
+        tenant_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        last_id: Optional[UUID] = None
+    ) -> List[User]:
+        """List users in a tenant, ordered by ID."""
+        return await self.inner.list_by_tenant(tenant_id, skip, limit, last_id)
+    
+    async def count_by_tenant(self, tenant_id: UUID) -> int:
+        """Count users in tenant."""
+        return await self.inner.count_by_tenant(tenant_id)
+    
+    async def estimated_count_by_tenant(self, tenant_id: UUID) -> int:
+        """Count users in tenant, served from the cache for up to its TTL."""
+        count = self.cache.tenant_counts.get(tenant_id)
+        if count is None:
+            count = await self.inner.count_by_tenant(tenant_id)
+            self.cache.tenant_counts.set(tenant_id, count)
+        return count
+    
+    async def email_exists(self, email: str) -> bool:
+        """Check if email exists."""
+        return await self.inner.email_exists(email)
+    
+    async def username_exists(self, username: str, tenant_id: UUID) -> bool:
+        """Check if username exists within tenant."""
+        return await self.inner.username_exists(username, tenant_id)
+    
+    async def record_login_result(
+        self,
+        user_id: UUID,
+        success: bool,
+        max_attempts: int = 5,
+        lockout_minutes: int = 30
+    ) -> Optional[LoginState]:
+        """Record a login attempt and evict the cached user."""
+        try:
+            result = await self.inner.record_login_result(user_id, success, max_attempts, lockout_minutes)
+        finally:
+            self.cache.evict(user_id)
+        if not success and result is not None and result.locked_until is not None:
+            self._changed(user_id)
+        return result
+    
+    async def replace_password_hash(self, user_id: UUID, old_hash: str, new_hash: str) -> bool:
+        """Swap the password hash if unchanged and evict the cached user."""
+        try:
+            return await self.inner.replace_password_hash(user_id, old_hash, new_hash)
+        finally:
+            self.cache.evict(user_id)
@@ -1,53 +1,143 @@
 """SQLAlchemy implementation of tenant repository."""
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Sequence, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
+from sqlalchemy import exists, insert, select
+from sqlalchemy.exc import IntegrityError
 
-from src.ai_hotline.shared.exceptions import DatabaseError, EntityNotFoundError
+from src.ai_hotline.shared.exceptions import DatabaseError, EntityAlreadyExistsError, EntityNotFoundError
 from src.ai_hotline.modules.identity.domain.entities.tenant import Tenant
+from src.ai_hotline.modules.identity.domain.entities.user import User
 from src.ai_hotline.modules.identity.domain.repositories import ITenantRepository
-from ..persistence.models import TenantModel
-from ..mappers.user_mapper import TenantMapper
+from ..persistence.models import TenantModel, UserModel
+from ..mappers.user_mapper import (
+    MappingContext,
+    TENANT_COLUMNS,
+    USER_COLUMNS,
+    tenant_from_row,
+    tenant_insert_values,
+    tenant_to_domain,
+    tenant_to_model,
+    tenants_from_rows,
+    tenants_to_insert_dicts,
+    update_tenant_model,
+    user_from_row,
+    user_insert_values,
+)
+
+# Tenant features/settings are deferred on the model; load them whenever
+# the tenant is mapped to a domain entity.
+_WITH_CONFIG = undefer_group("config")
+
+# List reads select plain columns through Core and build entities straight
+# from the rows, without ORM instances or identity-map bookkeeping.
+_tenants = TenantModel.__table__
+_TENANT_COLUMNS = tuple(_tenants.c[name] for name in TENANT_COLUMNS)
+_SELECT_TENANTS = select(*_TENANT_COLUMNS)
+_users = UserModel.__table__
+_USER_COLUMNS = tuple(_users.c[name] for name in USER_COLUMNS)
 
 
 class SqlAlchemyTenantRepository(ITenantRepository):
     """SQLAlchemy implementation of tenant repository."""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession, mapping_context: Optional[MappingContext] = None):
         self.session = session
+        self.mapping_context = mapping_context
+    
+    def _forget(self, tenant_id: UUID) -> None:
+        """Drop the request-scoped copy of a tenant that is about to change."""
+        if self.mapping_context is not None:
+            self.mapping_context.forget(tenant_id)
 
     async def create(self, tenant: Tenant) -> Tenant:
         """Create a new tenant."""
         try:
-            tenant_model = TenantMapper.to_model(tenant)
+            tenant_model = tenant_to_model(tenant)
             self.session.add(tenant_model)
-            self.session.commit()
-            self.session.refresh(tenant_model)
-            return TenantMapper.to_domain(tenant_model)
+            await self.session.commit()
+            return tenant_to_domain(tenant_model)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise EntityAlreadyExistsError(f"Tenant already exists: {e.orig}")
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to create tenant: {e}")
     
+    async def create_with_admin(self, tenant: Tenant, admin: User) -> Tuple[Tenant, User]:
+        """Create a tenant and its first admin user in one transaction."""
+        try:
+            # Two INSERT ... RETURNING statements and a single commit; the
+            # entities are built from the returned rows, with no refresh
+            tenant_row = (await self.session.execute(
+                insert(_tenants).values(tenant_insert_values(tenant)).returning(*_TENANT_COLUMNS)
+            )).one()
+            user_row = (await self.session.execute(
+                insert(_users).values(user_insert_values(admin)).returning(*_USER_COLUMNS)
+            )).one()
+            await self.session.commit()
+            return (
+                tenant_from_row(tenant_row, self.mapping_context),
+                user_from_row(user_row, self.mapping_context),
+            )
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise EntityAlreadyExistsError(f"Tenant or admin user already exists: {e.orig}")
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to create tenant with admin: {e}")
+    
+    async def create_many(self, tenants: Sequence[Tenant]) -> int:
+        """Insert tenants in one batched statement; returns the number inserted."""
+        if not tenants:
+            return 0
+        try:
+            await self.session.execute(insert(TenantModel), tenants_to_insert_dicts(tenants))
+            await self.session.commit()
+            return len(tenants)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise EntityAlreadyExistsError(f"Tenant already exists: {e.orig}")
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to create tenants: {e}")
+    
     async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
         """Get tenant by ID."""
         try:
-            tenant_model = self.session.query(TenantModel).filter(
-                and_(TenantModel.id == tenant_id)
-            ).first()
-            return TenantMapper.to_domain(tenant_model) if tenant_model else None
+            tenant_model = await self.session.scalar(
+                select(TenantModel).options(_WITH_CONFIG).where(TenantModel.id == tenant_id)
+            )
+            return tenant_to_domain(tenant_model, self.mapping_context) if tenant_model else None
         except Exception as e:
             raise DatabaseError(f"Failed to get tenant by ID: {e}")
     
+    async def get_by_ids(self, tenant_ids: Iterable[UUID]) -> Dict[UUID, Tenant]:
+        """Get tenants by ID in one query; missing tenants are left out."""
+        tenant_ids = set(tenant_ids)
+        mapped = self.mapping_context.tenants if self.mapping_context is not None else {}
+        tenants = {tenant_id: mapped[tenant_id] for tenant_id in tenant_ids if tenant_id in mapped}
+        missing = tenant_ids.difference(tenants)
+        if not missing:
+            return tenants
+        try:
+            rows = await self.session.execute(_SELECT_TENANTS.where(_tenants.c.id.in_(missing)))
+            for tenant in tenants_from_rows(rows, self.mapping_context):
+                tenants[tenant.id] = tenant
+            return tenants
+        except Exception as e:
+            raise DatabaseError(f"Failed to get tenants by ID: {e}")
+    
     async def get_by_name(self, name: str) -> Optional[Tenant]:
         """Get tenant by name."""
         try:
-            tenant_model = self.session.query(TenantModel).filter(
-                and_(TenantModel.name == name)
-            ).first()
-            return TenantMapper.to_domain(tenant_model) if tenant_model else None
+            tenant_model = await self.session.scalar(
+                select(TenantModel).options(_WITH_CONFIG).where(TenantModel.name == name)
+            )
+            return tenant_to_domain(tenant_model, self.mapping_context) if tenant_model else None
         except Exception as e:
             raise DatabaseError(f"Failed to get tenant by name: {e}")
     
@@ -55,98 +145,94 @@ class SqlAlchemyTenantRepository(ITenantRepository):
         """Update tenant."""
         try:
             # Get existing model
-            existing_model = self.session.query(TenantModel).filter(
-                TenantModel.id == tenant.id
-            ).first()
+            existing_model = await self.session.scalar(
+                select(TenantModel).options(_WITH_CONFIG).where(TenantModel.id == tenant.id)
+            )
             if not existing_model:
                 raise EntityNotFoundError("Tenant not found")
             
             # Update model from entity
-            TenantMapper.update_model_from_entity(existing_model, tenant)
-            self.session.commit()
-            self.session.refresh(existing_model)
-            return TenantMapper.to_domain(existing_model)
+            self._forget(tenant.id)
+            update_tenant_model(existing_model, tenant)
+            await self.session.commit()
+            return tenant_to_domain(existing_model)
         except EntityNotFoundError:
             raise
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to update tenant: {e}")
     
     async def delete(self, tenant_id: UUID) -> bool:
         """Delete tenant (soft delete)."""
         try:
-            tenant_model = self.session.query(TenantModel).filter(
-                TenantModel.id == tenant_id
-            ).first()
+            tenant_model = await self.session.scalar(
+                select(TenantModel).where(TenantModel.id == tenant_id)
+            )
             if not tenant_model:
                 return False
             
+            self._forget(tenant_id)
             # tenant_model.is_active = False
-            self.session.commit()
+            await self.session.commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to delete tenant: {e}")
     
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Tenant]:
         """List all active tenants."""
         try:
-            tenant_models = self.session.query(TenantModel).offset(skip).limit(limit).all()
-            return [TenantMapper.to_domain(model) for model in tenant_models]
+            rows = await self.session.execute(_SELECT_TENANTS.offset(skip).limit(limit))
+            return tenants_from_rows(rows, self.mapping_context)
         except Exception as e:
             raise DatabaseError(f"Failed to list tenants: {e}")
     
     async def name_exists(self, name: str) -> bool:
         """Check if tenant name already exists."""
         try:
-            count = self.session.query(TenantModel).filter(
-                and_(TenantModel.name == name)
-            ).count()
-            return count > 0
+            return await self.session.scalar(
+                select(exists().where(_tenants.c.name == name))
+            )
         except Exception as e:
             raise DatabaseError(f"Failed to check tenant name existence: {e}")
     
     async def get_active_trial_tenants(self) -> List[Tenant]:
         """Get all active trial tenants."""
         try:
-            tenant_models = self.session.query(TenantModel).filter(
-                and_(
-                    TenantModel.status == "trial"
-                )
-            ).all()
-            return [TenantMapper.to_domain(model) for model in tenant_models]
+            rows = await self.session.execute(_SELECT_TENANTS.where(_tenants.c.status == "trial"))
+            return tenants_from_rows(rows, self.mapping_context)
         except Exception as e:
             raise DatabaseError(f"Failed to get trial tenants: {e}")
     
     async def get_expired_trial_tenants(self) -> List[Tenant]:
         """Get all expired trial tenants."""
-        from datetime import datetime
         try:
-            tenant_models = self.session.query(TenantModel).filter(
-                and_(
-                    TenantModel.status == "trial",
-                    TenantModel.trial_ends_at <= datetime.utcnow()
+            rows = await self.session.execute(
+                _SELECT_TENANTS.where(
+                    _tenants.c.status == "trial",
+                    _tenants.c.trial_ends_at <= datetime.utcnow()
                 )
-            ).all()
-            return [TenantMapper.to_domain(model) for model in tenant_models]
+            )
+            return tenants_from_rows(rows, self.mapping_context)
         except Exception as e:
             raise DatabaseError(f"Failed to get expired trial tenants: {e}")
     
     async def update_tenant_status(self, tenant_id: UUID, new_status: str) -> bool:
         """Update tenant status."""
         try:
-            tenant_model = self.session.query(TenantModel).filter(
-                TenantModel.id == tenant_id
-            ).first()
+            tenant_model = await self.session.scalar(
+                select(TenantModel).where(TenantModel.id == tenant_id)
+            )
             if not tenant_model:
                 return False
             
+            self._forget(tenant_id)
             tenant_model.status = new_status
             tenant_model.updated_at = datetime.utcnow()
-            self.session.commit()
+            await self.session.commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to update tenant status: {e}")
     
     async def update_tenant_limits(
@@ -158,12 +244,13 @@ class SqlAlchemyTenantRepository(ITenantRepository):
     ) -> bool:
         """Update tenant limits."""
         try:
-            tenant_model = self.session.query(TenantModel).filter(
-                TenantModel.id == tenant_id
-            ).first()
+            tenant_model = await self.session.scalar(
+                select(TenantModel).where(TenantModel.id == tenant_id)
+            )
             if not tenant_model:
                 return False
             
+            self._forget(tenant_id)
             if max_users is not None:
                 tenant_model.max_users = max_users
             if max_calls_per_month is not None:
@@ -172,8 +259,8 @@ class SqlAlchemyTenantRepository(ITenantRepository):
                 tenant_model.max_storage_mb = max_storage_mb
             
             tenant_model.updated_at = datetime.utcnow()
-            self.session.commit()
+            await self.session.commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to update tenant limits: {e}")
@@ -1,66 +1,206 @@
 """SQLAlchemy implementation of user repository."""
 
-from typing import Optional, List
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Optional, List, Sequence, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import case, exists, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 
-from src.ai_hotline.shared.exceptions import DatabaseError, EntityNotFoundError
+from src.ai_hotline.shared.exceptions import DatabaseError, EntityAlreadyExistsError, EntityNotFoundError, ValidationError
 from src.ai_hotline.modules.identity.domain.entities.user import User
-from src.ai_hotline.modules.identity.domain.repositories import IUserRepository
+from src.ai_hotline.modules.identity.domain.repositories import IUserRepository, LoginState, MAX_PAGE_SIZE
 from ..persistence.models import UserModel
-from ..mappers.user_mapper import UserMapper
+from ..mappers.user_mapper import (
+    MappingContext,
+    USER_COLUMNS,
+    update_user_model,
+    user_from_row,
+    user_insert_values,
+    user_to_domain,
+    users_from_rows,
+    users_to_insert_dicts,
+    users_to_update_dicts,
+)
+
+# Read queries select plain columns through Core and skip ORM instance
+# construction; the ORM model is only loaded on write paths.
+_users = UserModel.__table__
+_USER_COLUMNS = tuple(_users.c[name] for name in USER_COLUMNS)
+_SELECT_USERS = select(*_USER_COLUMNS)
+
+# Users fetched ahead of time by with_primed_users, scoped to the current
+# request context and consulted by get_by_id before querying.
+_primed_users: ContextVar[Optional[Dict[UUID, User]]] = ContextVar("primed_users", default=None)
+
+
+async def with_primed_users(
+    repository: IUserRepository,
+    user_ids: Iterable[UUID] | AsyncIterable[UUID],
+    chunk_size: int = 100,
+) -> AsyncIterator[Tuple[UUID, Optional[User]]]:
+    """
+    Yield ``(user_id, user)`` pairs, loading users ``chunk_size`` at a time.
+    
+    Each chunk is fetched with a single ``get_by_ids`` query and stored in
+    the request-scoped primed cache, so ``get_by_id`` calls made while
+    handling the yielded items do not hit the database again.
+    
+    Priming happens only as the generator is iterated; ids that have not
+    been reached yet are not loaded.
+    """
+    primed = _primed_users.get()
+    if primed is None:
+        primed = {}
+        _primed_users.set(primed)
+    
+    async def flush(chunk: List[UUID]):
+        missing = [user_id for user_id in chunk if user_id not in primed]
+        if missing:
+            primed.update(await repository.get_by_ids(missing))
+        for user_id in chunk:
+            yield user_id, primed.get(user_id)
+    
+    chunk: List[UUID] = []
+    if isinstance(user_ids, AsyncIterable):
+        async for user_id in user_ids:
+            chunk.append(user_id)
+            if len(chunk) >= chunk_size:
+                async for item in flush(chunk):
+                    yield item
+                chunk = []
+    else:
+        for user_id in user_ids:
+            chunk.append(user_id)
+            if len(chunk) >= chunk_size:
+                async for item in flush(chunk):
+                    yield item
+                chunk = []
+    
+    if chunk:
+        async for item in flush(chunk):
+            yield item
+
+
+def _forget_primed_user(user_id: UUID) -> None:
+    """Drop a user from the primed cache after it changes."""
+    primed = _primed_users.get()
+    if primed:
+        primed.pop(user_id, None)
 
 
 class SqlAlchemyUserRepository(IUserRepository):
     """SQLAlchemy implementation of user repository."""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession, mapping_context: Optional[MappingContext] = None):
         self.session = session
+        self.mapping_context = mapping_context
+    
+    def _forget(self, user_id: UUID) -> None:
+        """Drop request-scoped copies of a user that is about to change."""
+        _forget_primed_user(user_id)
+        if self.mapping_context is not None:
+            self.mapping_context.forget(user_id)
     
     async def create(self, user: User) -> User:
         """Create a new user."""
         try:
-            user_model = UserMapper.to_model(user)
-            self.session.add(user_model)
-            self.session.commit()
-            self.session.refresh(user_model)
-            return UserMapper.to_domain(user_model)
+            # A Core INSERT ... RETURNING writes and reads back the row in one
+            # round trip, without building and refreshing a UserModel
+            row = (await self.session.execute(
+                insert(_users).values(user_insert_values(user)).returning(*_USER_COLUMNS)
+            )).one()
+            await self.session.commit()
+            return user_from_row(row, self.mapping_context)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise EntityAlreadyExistsError(f"User already exists: {e.orig}")
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to create user: {e}")
     
+    async def create_many(self, users: Sequence[User]) -> int:
+        """Insert users in one batched statement; returns the number inserted."""
+        if not users:
+            return 0
+        try:
+            # insertmanyvalues batches the rows into multi-row INSERTs and
+            # RETURNING reports what was actually written
+            inserted = (await self.session.execute(
+                insert(UserModel).returning(UserModel.id), users_to_insert_dicts(users)
+            )).all()
+            await self.session.commit()
+            return len(inserted)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise EntityAlreadyExistsError(f"User already exists: {e.orig}")
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to create users: {e}")
+    
+    async def update_many(self, users: Sequence[User]) -> int:
+        """Update users by ID in one batched statement; returns the number given."""
+        if not users:
+            return 0
+        for user in users:
+            self._forget(user.id)
+        try:
+            await self.session.execute(update(UserModel), users_to_update_dicts(users))
+            await self.session.commit()
+            return len(users)
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to update users: {e}")
+    
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID."""
+        primed = _primed_users.get()
+        if primed and user_id in primed:
+            return primed[user_id]
+        
         try:
-            user_model = self.session.query(UserModel).filter(
-                and_(UserModel.id == user_id, UserModel.is_active == True)
-            ).first()
-            return UserMapper.to_domain(user_model) if user_model else None
+            row = (await self.session.execute(
+                _SELECT_USERS.where(_users.c.id == user_id, _users.c.is_active == True)
+            )).first()
+            return user_from_row(row, self.mapping_context) if row else None
         except Exception as e:
             raise DatabaseError(f"Failed to get user by ID: {e}")
     
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """Get users by ID in one query; missing users are left out."""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        try:
+            rows = await self.session.execute(
+                _SELECT_USERS.where(_users.c.id.in_(user_ids), _users.c.is_active == True)
+            )
+            return {user.id: user for user in users_from_rows(rows, self.mapping_context)}
+        except Exception as e:
+            raise DatabaseError(f"Failed to get users by ID: {e}")
+    
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
         try:
-            user_model = self.session.query(UserModel).filter(
-                and_(UserModel.email == email, UserModel.is_active == True)
-            ).first()
-            return UserMapper.to_domain(user_model) if user_model else None
+            row = (await self.session.execute(
+                _SELECT_USERS.where(_users.c.email == email, _users.c.is_active == True)
+            )).first()
+            return user_from_row(row, self.mapping_context) if row else None
         except Exception as e:
             raise DatabaseError(f"Failed to get user by email: {e}")
     
     async def get_by_username(self, username: str, tenant_id: UUID) -> Optional[User]:
         """Get user by username within tenant."""
         try:
-            user_model = self.session.query(UserModel).filter(
-                and_(
-                    UserModel.username == username,
-                    UserModel.tenant_id == tenant_id,
-                    UserModel.is_active == True
+            row = (await self.session.execute(
+                _SELECT_USERS.where(
+                    _users.c.username == username,
+                    _users.c.tenant_id == tenant_id,
+                    _users.c.is_active == True
                 )
-            ).first()
-            return UserMapper.to_domain(user_model) if user_model else None
+            )).first()
+            return user_from_row(row, self.mapping_context) if row else None
         except Exception as e:
             raise DatabaseError(f"Failed to get user by username: {e}")
     
@@ -68,85 +208,155 @@ class SqlAlchemyUserRepository(IUserRepository):
         """Update user."""
         try:
             # Get existing model
-            existing_model = self.session.query(UserModel).filter(UserModel.id == user.id).first()
+            existing_model = await self.session.scalar(select(UserModel).where(UserModel.id == user.id))
             if not existing_model:
                 raise EntityNotFoundError("User not found")
             
             # Update model from entity
-            UserMapper.update_model_from_entity(existing_model, user)
-            self.session.commit()
-            self.session.refresh(existing_model)
-            return UserMapper.to_domain(existing_model)
+            self._forget(user.id)
+            update_user_model(existing_model, user)
+            await self.session.commit()
+            return user_to_domain(existing_model)
         except EntityNotFoundError:
             raise
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to update user: {e}")
     
     async def delete(self, user_id: UUID) -> bool:
         """Delete user (soft delete)."""
         try:
-            user_model = self.session.query(UserModel).filter(UserModel.id == user_id).first()
+            user_model = await self.session.scalar(select(UserModel).where(UserModel.id == user_id))
             if not user_model:
                 return False
             
+            self._forget(user_id)
             user_model.soft_delete()
-            self.session.commit()
+            await self.session.commit()
             return True
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise DatabaseError(f"Failed to delete user: {e}")
     
     async def list_by_tenant(
         self, 
         tenant_id: UUID, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        last_id: Optional[UUID] = None
     ) -> List[User]:
-        """List users in a tenant."""
+        """List users in a tenant, ordered by ID."""
+        if skip < 0:
+            raise ValidationError("skip must not be negative")
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        
+        conditions = [_users.c.tenant_id == tenant_id, _users.c.is_active == True]
+        if last_id is not None:
+            conditions.append(_users.c.id > last_id)
         try:
-            user_models = self.session.query(UserModel).filter(
-                and_(
-                    UserModel.tenant_id == tenant_id,
-                    UserModel.is_active == True
-                )
-            ).offset(skip).limit(limit).all()
-            return [UserMapper.to_domain(model) for model in user_models]
+            query = _SELECT_USERS.where(*conditions).order_by(_users.c.id)
+            if skip:
+                query = query.offset(skip)
+            rows = await self.session.execute(query.limit(limit))
+            return users_from_rows(rows, self.mapping_context)
         except Exception as e:
             raise DatabaseError(f"Failed to list users by tenant: {e}")
     
     async def count_by_tenant(self, tenant_id: UUID) -> int:
         """Count users in a tenant."""
         try:
-            return self.session.query(UserModel).filter(
-                and_(
-                    UserModel.tenant_id == tenant_id,
-                    UserModel.is_active == True
+            return await self.session.scalar(
+                select(func.count()).select_from(_users).where(
+                    _users.c.tenant_id == tenant_id,
+                    _users.c.is_active == True
                 )
-            ).count()
+            )
         except Exception as e:
             raise DatabaseError(f"Failed to count users by tenant: {e}")
     
+    async def estimated_count_by_tenant(self, tenant_id: UUID) -> int:
+        """Count users in a tenant; uncached, so the count is exact."""
+        return await self.count_by_tenant(tenant_id)
+    
     async def email_exists(self, email: str) -> bool:
         """Check if email already exists."""
         try:
-            count = self.session.query(UserModel).filter(
-                and_(UserModel.email == email, UserModel.is_active == True)
-            ).count()
-            return count > 0
+            return await self.session.scalar(
+                select(exists().where(_users.c.email == email, _users.c.is_active == True))
+            )
         except Exception as e:
             raise DatabaseError(f"Failed to check email existence: {e}")
     
     async def username_exists(self, username: str, tenant_id: UUID) -> bool:
         """Check if username exists in tenant."""
         try:
-            count = self.session.query(UserModel).filter(
-                and_(
-                    UserModel.username == username,
-                    UserModel.tenant_id == tenant_id,
-                    UserModel.is_active == True
-                )
-            ).count()
-            return count > 0
+            return await self.session.scalar(
+                select(exists().where(
+                    _users.c.username == username,
+                    _users.c.tenant_id == tenant_id,
+                    _users.c.is_active == True
+                ))
+            )
         except Exception as e:
             raise DatabaseError(f"Failed to check username existence: {e}")
+    
+    async def record_login_result(
+        self,
+        user_id: UUID,
+        success: bool,
+        max_attempts: int = 5,
+        lockout_minutes: int = 30
+    ) -> Optional[LoginState]:
+        """Record a login attempt in a single statement, without reading the user first."""
+        self._forget(user_id)
+        now = datetime.utcnow()
+        conditions = [UserModel.id == user_id]
+        if success:
+            # Never clear a lock that is still active: the caller's lock check
+            # may have read a cached user from before another worker locked it
+            conditions.append(or_(UserModel.locked_until.is_(None), UserModel.locked_until <= now))
+            values = dict(last_login_at=now, failed_login_attempts=0, locked_until=None)
+        else:
+            # Both SET expressions see the pre-update row, and the UPDATE
+            # itself holds the row lock, so concurrent failures are counted.
+            attempts = UserModel.failed_login_attempts + 1
+            values = dict(
+                failed_login_attempts=attempts,
+                locked_until=case(
+                    (attempts >= max_attempts, now + timedelta(minutes=lockout_minutes)),
+                    else_=UserModel.locked_until,
+                ),
+            )
+        try:
+            result = await self.session.execute(
+                update(UserModel)
+                .where(*conditions)
+                .values(**values)
+                .returning(
+                    UserModel.failed_login_attempts,
+                    UserModel.locked_until,
+                    UserModel.last_login_at,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            row = result.first()
+            await self.session.commit()
+            return LoginState(*row) if row else None
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to record login result: {e}")
+    
+    async def replace_password_hash(self, user_id: UUID, old_hash: str, new_hash: str) -> bool:
+        """Swap a user's password hash only if it still equals ``old_hash``."""
+        self._forget(user_id)
+        try:
+            result = await self.session.execute(
+                update(_users)
+                .where(_users.c.id == user_id, _users.c.password_hash == old_hash)
+                .values(password_hash=new_hash)
+            )
+            await self.session.commit()
+            return result.rowcount == 1
+        except Exception as e:
+            await self.session.rollback()
+            raise DatabaseError(f"Failed to replace password hash: {e}")
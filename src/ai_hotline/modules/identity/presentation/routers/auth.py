@@ -1,16 +1,27 @@
 """Authentication API router."""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.ai_hotline.shared.database import get_db
+from src.ai_hotline.shared.cache import get_redis
+from src.ai_hotline.shared.database import get_db, get_db_context
+from src.ai_hotline.shared.security.auth import TokenData
 from src.ai_hotline.shared.exceptions import (
     AuthenticationError,
     EntityNotFoundError,
     BusinessRuleViolationError
 )
-from src.ai_hotline.modules.identity.application.services.auth_service import AuthenticationService
+from src.ai_hotline.modules.identity.application.services.auth_service import (
+    AuthenticationService,
+    invalidate_cached_token_users,
+)
+from src.ai_hotline.modules.identity.domain.repositories import IUserRepository
+from src.ai_hotline.modules.identity.infrastructure.mappers import MappingContext
+from src.ai_hotline.modules.identity.infrastructure.repositories.caching_user_repository import CachingUserRepository
 from src.ai_hotline.modules.identity.infrastructure.repositories.user_repository import SqlAlchemyUserRepository
 from src.ai_hotline.modules.identity.infrastructure.repositories.tenant_repository import SqlAlchemyTenantRepository
 from src.ai_hotline.modules.identity.presentation.schemas.auth import (
@@ -32,21 +43,42 @@ security = HTTPBearer()
 router = APIRouter(tags=["Authentication"])
 
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthenticationService:
+def get_mapping_context() -> MappingContext:
+    """Dependency to get a mapping context shared for the current request."""
+    return MappingContext()
+
+
+@asynccontextmanager
+async def open_user_repository() -> AsyncIterator[IUserRepository]:
+    """Open a user repository on its own session, for work that outlives the request."""
+    async with get_db_context() as session:
+        yield CachingUserRepository(
+            SqlAlchemyUserRepository(session), on_user_changed=invalidate_cached_token_users
+        )
+
+
+def get_auth_service(
+    db: AsyncSession = Depends(get_db),
+    mapping_context: MappingContext = Depends(get_mapping_context)
+) -> AuthenticationService:
     """Dependency to get authentication service."""
-    user_repository = SqlAlchemyUserRepository(db)
-    tenant_repository = SqlAlchemyTenantRepository(db)
-    return AuthenticationService(user_repository, tenant_repository)
+    user_repository = CachingUserRepository(
+        SqlAlchemyUserRepository(db, mapping_context), on_user_changed=invalidate_cached_token_users
+    )
+    tenant_repository = SqlAlchemyTenantRepository(db, mapping_context)
+    return AuthenticationService(
+        user_repository, tenant_repository, get_redis(), user_repository_scope=open_user_repository
+    )
 
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthenticationService = Depends(get_auth_service)
 ):
     """Dependency to get current authenticated user."""
     try:
         token = credentials.credentials
-        user = auth_service.verify_token_and_get_user(token)
+        user = await auth_service.verify_token_and_get_user(token)
         return user
     except AuthenticationError as e:
         raise HTTPException(
@@ -55,6 +87,21 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+
+async def get_current_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthenticationService = Depends(get_auth_service)
+) -> TokenData:
+    """Dependency to get the verified access token claims without a user lookup."""
+    try:
+        return await auth_service.verify_token_claims(credentials.credentials)
+    except AuthenticationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
 @router.post("/register-tenant-admin", response_model=LoginResponse)
 async def register_tenant_admin(
     request: RegisterTenantWithAdminRequest,
@@ -86,7 +133,7 @@ async def register_tenant_admin(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=30 * 60,  # 30 minutes
-            user=UserResponse.from_orm(user)
+            user=UserResponse.model_validate(user)
         )
         
     except BusinessRuleViolationError as e:
@@ -130,7 +177,7 @@ async def register_tenant_user(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=30 * 60,  # 30 minutes
-            user=UserResponse.from_orm(user)
+            user=UserResponse.model_validate(user)
         )
         
     except BusinessRuleViolationError as e:
@@ -172,7 +219,7 @@ async def login(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=30 * 60,  # 30 minutes
-            user=UserResponse.from_orm(user)
+            user=UserResponse.model_validate(user)
         )
         
     except AuthenticationError as e:
@@ -240,7 +287,7 @@ async def get_current_user_info(
     Returns:
         User information
     """
-    return UserResponse.from_orm(current_user)
+    return UserResponse.model_validate(current_user)
 
 
 @router.post("/change-password")
@@ -291,13 +338,17 @@ async def change_password(
 
 @router.post("/logout")
 async def logout(
-    current_user = Depends(get_current_user)
+    claims: TokenData = Depends(get_current_token_claims),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthenticationService = Depends(get_auth_service)
 ):
     """
     Logout user (client should discard tokens).
     
     Args:
-        current_user: Current authenticated user
+        claims: Verified claims of the current access token
+        credentials: Bearer credentials of the current request
+        auth_service: Authentication service
         
     Returns:
         Success message
@@ -305,7 +356,9 @@ async def logout(
     # In a more sophisticated implementation, we might:
     # - Add tokens to a blacklist in Redis
     # - Track user sessions
-    # For now, we just return success (client handles token disposal)    return {"message": "Logged out successfully"}
+    # For now, drop the server-side token cache entry (client handles token disposal)
+    auth_service.invalidate_token(credentials.credentials)
+    return {"message": "Logged out successfully"}
 
 
 # Note: Exception handlers should be registered in main.py with the FastAPI app instance
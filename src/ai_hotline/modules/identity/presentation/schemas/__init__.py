@@ -3,10 +3,14 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, field_validator
-import re
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from src.ai_hotline.modules.identity.domain.entities.user import UserRole, UserStatus
+from src.ai_hotline.modules.identity.domain.value_objects import (
+    TENANT_NAME_RE,
+    USERNAME_RE,
+    check_password_strength,
+)
 
 
 class UserLoginRequest(BaseModel):
@@ -41,23 +45,7 @@ class ChangePasswordRequest(BaseModel):
     @classmethod
     def validate_password_strength(cls, v):
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters")
-        
-        # Check for basic strength requirements
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
-        
-        if sum(strength_checks) < 3:
-            raise ValueError(
-                "Password must contain at least 3 of: uppercase, lowercase, digit, special character"
-            )
-        
-        return v
+        return check_password_strength(v)
 
 
 class UserCreateRequest(BaseModel):
@@ -74,7 +62,7 @@ class UserCreateRequest(BaseModel):
     @classmethod
     def validate_username(cls, v):
         """Validate username format."""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not USERNAME_RE.match(v):
             raise ValueError(
                 "Username can only contain letters, numbers, underscore, and dash"
             )
@@ -84,23 +72,7 @@ class UserCreateRequest(BaseModel):
     @classmethod
     def validate_password_strength(cls, v):
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters")
-        
-        # Check for basic strength requirements
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
-        
-        if sum(strength_checks) < 3:
-            raise ValueError(
-                "Password must contain at least 3 of: uppercase, lowercase, digit, special character"
-            )
-        
-        return v
+        return check_password_strength(v)
 
 
 class UserUpdateRequest(BaseModel):
@@ -127,8 +99,7 @@ class UserResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserListResponse(BaseModel):
@@ -153,7 +124,7 @@ class TenantCreateRequest(BaseModel):
     @classmethod
     def validate_tenant_name(cls, v):
         """Validate tenant name format."""
-        if not re.match(r'^[a-zA-Z0-9\s\-_.&()]+$', v):
+        if not TENANT_NAME_RE.match(v):
             raise ValueError("Tenant name contains invalid characters")
         return v
 
@@ -174,8 +145,7 @@ class TenantResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ErrorResponse(BaseModel):
@@ -3,10 +3,11 @@
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from src.ai_hotline.modules.identity.domain.entities.user import UserRole, UserStatus
 from src.ai_hotline.modules.identity.domain.entities.tenant import TenantStatus
+from src.ai_hotline.modules.identity.domain.value_objects import check_password_strength
 
 
 # User Schemas
@@ -28,22 +29,7 @@ class UserCreate(UserBase):
     @classmethod
     def validate_password(cls, v):
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters')
-        
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
-        
-        if sum(strength_checks) < 3:
-            raise ValueError(
-                'Password must contain at least 3 of: uppercase, lowercase, digit, special character'
-            )
-        
-        return v
+        return check_password_strength(v)
 
 
 class UserUpdate(BaseModel):
@@ -68,8 +54,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserList(BaseModel):
@@ -102,22 +87,7 @@ class RegisterUserRequest(BaseModel):
     @classmethod
     def validate_password(cls, v):
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters')
-        
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
-        
-        if sum(strength_checks) < 3:
-            raise ValueError(
-                'Password must contain at least 3 of: uppercase, lowercase, digit, special character'
-            )
-        
-        return v
+        return check_password_strength(v)
     
 class RegisterResponse(BaseModel):
     """Schema for user registration response."""
@@ -139,8 +109,7 @@ class LoginResponse(BaseModel):
     expires_in: int
     user: Optional[UserResponse]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class RefreshTokenRequest(BaseModel):
     """Schema for token refresh request."""
@@ -163,22 +132,7 @@ class ChangePasswordRequest(BaseModel):
     @classmethod
     def validate_new_password(cls, v):
         """Validate new password strength."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters')
-        
-        has_upper = any(c.isupper() for c in v)
-        has_lower = any(c.islower() for c in v)
-        has_digit = any(c.isdigit() for c in v)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in v)
-        
-        strength_checks = [has_upper, has_lower, has_digit, has_special]
-        
-        if sum(strength_checks) < 3:
-            raise ValueError(
-                'Password must contain at least 3 of: uppercase, lowercase, digit, special character'
-            )
-        
-        return v
+        return check_password_strength(v)
 
 
 # Tenant Schemas
@@ -224,8 +178,7 @@ class TenantResponse(TenantBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TenantList(BaseModel):
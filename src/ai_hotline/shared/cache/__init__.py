@@ -0,0 +1,6 @@
+"""Cache package exports."""
+
+from .redis_client import get_redis, close_redis
+from .ttl_cache import TTLCache
+
+__all__ = ["get_redis", "close_redis", "TTLCache"]
@@ -0,0 +1,41 @@
+"""Shared Redis client management."""
+
+from typing import Optional
+
+import redis.asyncio as redis
+
+from ..config import get_settings
+from ..logging import get_logger
+
+logger = get_logger("cache.redis")
+
+# Global client; connections are opened lazily by the client's pool
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Get the shared Redis client, creating it on first use."""
+    global _client
+    
+    if _client is None:
+        settings = get_settings()
+        _client = redis.from_url(
+            settings.redis.redis_url,
+            max_connections=settings.redis.max_connections,
+            socket_timeout=settings.redis.socket_timeout,
+            retry_on_timeout=settings.redis.retry_on_timeout,
+            decode_responses=True,
+        )
+        logger.info("Redis client created")
+    
+    return _client
+
+
+async def close_redis() -> None:
+    """Close Redis connections."""
+    global _client
+    
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Redis connections closed")
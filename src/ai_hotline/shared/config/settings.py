@@ -1,6 +1,7 @@
 """Application configuration settings."""
 
 import os
+from functools import lru_cache
 from typing import List, Optional, Union
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -18,7 +19,7 @@ class DatabaseSettings(BaseSettings):
     pool_size: int = Field(default=5, env="DB_POOL_SIZE")
     max_overflow: int = Field(default=10, env="DB_MAX_OVERFLOW")
     pool_timeout: int = Field(default=30, env="DB_POOL_TIMEOUT")
-    pool_recycle: int = Field(default=3600, env="DB_POOL_RECYCLE")
+    pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")
     
     model_config = {
         "env_file": ".env",
@@ -73,6 +74,13 @@ class SecuritySettings(BaseSettings):
     max_login_attempts: int = Field(default=5, env="MAX_LOGIN_ATTEMPTS")
     lockout_duration_minutes: int = Field(default=30, env="LOCKOUT_DURATION_MINUTES")
     
+    # User lookup cache settings. Each worker caches users on its own, so a
+    # change made through another worker (e.g. suspending a user) is only
+    # seen here once the entry expires; users resolved from access tokens are
+    # cached the same way for up to 30 seconds.
+    user_cache_maxsize: int = Field(default=4096, env="USER_CACHE_MAXSIZE")
+    user_cache_ttl_seconds: int = Field(default=60, env="USER_CACHE_TTL_SECONDS")
+    
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -164,6 +172,7 @@ class AppSettings(BaseSettings):
     version: str = Field(default="1.0.0", env="APP_VERSION")
     environment: str = Field(default="development", env="ENVIRONMENT")
     debug: bool = Field(default=True, env="DEBUG")
+    skip_migrations: bool = Field(default=False, env="SKIP_MIGRATIONS")
     
     # Server settings
     host: str = Field(default="0.0.0.0", env="HOST")
@@ -232,16 +241,10 @@ class AppSettings(BaseSettings):
     }
 
 
-# Global settings instance
-_settings: Optional[AppSettings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
-    """Get application settings instance (singleton)."""
-    global _settings
-    if _settings is None:
-        _settings = AppSettings()
-    return _settings
+    """Get application settings instance (cached singleton)."""
+    return AppSettings()
 
 
 def get_app_settings() -> AppSettings:
@@ -251,6 +254,5 @@ def get_app_settings() -> AppSettings:
 
 def reload_settings() -> AppSettings:
     """Reload settings from environment (useful for testing)."""
-    global _settings
-    _settings = AppSettings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
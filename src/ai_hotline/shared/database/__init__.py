@@ -4,6 +4,7 @@ from .session import (
     Base,
     init_database,
     close_database,
+    warm_connection_pool,
     get_db,
     get_db_context,
     get_engine,
@@ -25,6 +26,7 @@ __all__ = [
     "Base",
     "init_database",
     "close_database",
+    "warm_connection_pool",
     "get_db",
     "get_db_context",
     "get_engine",
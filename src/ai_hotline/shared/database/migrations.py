@@ -1,6 +1,7 @@
 """Database migration utilities for application startup."""
 
 import logging
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -60,8 +61,14 @@ class MigrationManager:
             logger.error(f"Unexpected error with Alembic: {e}")
             return False
     
-    def _run_alembic_command(self, command_args: list) -> tuple[bool, str]:
-        """Run Alembic command via subprocess as fallback."""
+    def _run_alembic_command(
+        self, command_args: list, capture_output: bool = True
+    ) -> tuple[bool, str]:
+        """Run Alembic command via subprocess as fallback.
+        
+        With ``capture_output=False`` the command writes straight to this
+        process's stdout/stderr and an empty string is returned as output.
+        """
         try:
             # Construct the full command
             cmd = [sys.executable, "-m", "alembic"] + command_args
@@ -76,16 +83,16 @@ class MigrationManager:
                 cmd,
                 cwd=str(self.project_root),
                 env=env,
-                capture_output=True,
+                capture_output=capture_output,
                 text=True,
                 timeout=60
             )
             
             if result.returncode == 0:
-                return True, result.stdout
+                return True, result.stdout or ""
             else:
-                logger.error(f"Alembic command failed: {result.stderr}")
-                return False, result.stderr
+                logger.error(f"Alembic command failed: {result.stderr or result.returncode}")
+                return False, result.stderr or f"Exit code {result.returncode}"
                 
         except subprocess.TimeoutExpired:
             logger.error("Alembic command timed out")
@@ -215,7 +222,9 @@ class MigrationManager:
             logger.warning(f"Alembic API failed, trying subprocess: {api_error}")
             
             # Fallback to subprocess approach
-            success, output = self._run_alembic_command(["upgrade", target_revision])
+            success, output = self._run_alembic_command(
+                ["upgrade", target_revision], capture_output=False
+            )
             if success:
                 logger.info("Migrations applied successfully via subprocess")
                 return True
@@ -1,44 +1,75 @@
 """Database session management."""
 
-from sqlalchemy import create_engine, Engine, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
+import asyncio
+import orjson
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Optional
 
 from ..config import get_settings
 from ..logging import get_logger
 
 logger = get_logger("database.session")
 
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson.
+    
+    Naive datetimes are treated as UTC, matching the utcnow() timestamps
+    used throughout the models.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NAIVE_UTC).decode()
+
+
 # Create the base class for declarative models
 Base = declarative_base()
 
 # Global variables for engine and session
-_engine: Engine = None
-_SessionLocal: sessionmaker = None
+_engine: AsyncEngine = None
+_SessionLocal: async_sessionmaker = None
 
 
-def create_database_engine() -> Engine:
-    """Create database engine with connection pooling."""
+def create_database_engine() -> AsyncEngine:
+    """Create the asyncpg database engine with connection pooling."""
     settings = get_settings()
+    database = settings.database
     
-    engine = create_engine(
+    # Connections are pinged on checkout and recycled well before typical
+    # server/proxy idle timeouts, so stale sockets never reach a request.
+    engine = create_async_engine(
         settings.database_url,
+        poolclass=AsyncAdaptedQueuePool,
         pool_pre_ping=True,
-        pool_recycle=300,
-        pool_size=5,
-        max_overflow=0,
+        pool_recycle=database.pool_recycle,
+        pool_size=database.pool_size,
+        max_overflow=database.max_overflow,
+        pool_timeout=database.pool_timeout,
         echo=settings.debug,  # Log SQL queries in debug mode
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
     )
     
     logger.info("Database engine created successfully")
     return engine
 
 
-def create_session_maker(engine: Engine) -> sessionmaker:
-    """Create session maker."""
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def create_session_maker(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Create session maker.
+    
+    Objects stay loaded after commit, so repositories can map them without
+    an implicit (and, under asyncio, disallowed) reload.
+    """
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 
 def init_database():
@@ -55,16 +86,23 @@ def init_database():
         )
         
         # Create synchronous engine for table creation
-        sync_engine = create_engine(sync_database_url)
+        sync_engine = create_engine(
+            sync_database_url,
+            json_serializer=json_serializer,
+            json_deserializer=orjson.loads,
+        )
         
-        # Test connection first
-        with sync_engine.connect() as conn:
+        # Test connection first and make sure required extensions exist
+        with sync_engine.begin() as conn:
             conn.execute(text("SELECT 1"))
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext"))
         
         # Import all models to ensure they're registered with Base
         # Note: These imports must be here to avoid circular imports
         from ...modules.identity.infrastructure.persistence.models import UserModel, TenantModel
-        from ...modules.call_processing.infrastructure.persistence.models import CallModel, CallSessionModel
+        from ...modules.call_processing.infrastructure.persistence.models import (
+            CallModel, CallSessionModel, CallSessionEventModel
+        )
         
         # Create all tables using synchronous engine
         Base.metadata.create_all(bind=sync_engine)
@@ -84,16 +122,61 @@ def init_database():
         raise
 
 
-def close_database():
+async def close_database():
     """Close database connections."""
     global _engine
     
     if _engine:
-        _engine.dispose()
+        await _engine.dispose()
         logger.info("Database connections closed")
 
 
-def get_db() -> Generator[Session, None, None]:
+async def _open_warm_connection(engine: AsyncEngine) -> AsyncConnection:
+    """Check out a pooled connection and run a trivial query on it."""
+    connection = await engine.connect()
+    try:
+        await connection.execute(text("SELECT 1"))
+    except BaseException:
+        await connection.close()
+        raise
+    return connection
+
+
+async def warm_connection_pool(size: Optional[int] = None) -> int:
+    """
+    Pre-establish pooled connections so the first requests skip the handshake.
+    
+    All connections are held open at the same time so the pool creates
+    ``size`` distinct connections, then they are returned to the pool.
+    
+    Args:
+        size: Number of connections to open (defaults to the pool size)
+        
+    Returns:
+        Number of connections successfully warmed
+    """
+    engine = get_engine()
+    pool_size = engine.pool.size()
+    size = min(size, pool_size) if size else pool_size
+    
+    results = await asyncio.gather(
+        *(_open_warm_connection(engine) for _ in range(size)),
+        return_exceptions=True,
+    )
+    
+    warmed = 0
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to warm database connection: {result}")
+            continue
+        await result.close()
+        warmed += 1
+    
+    logger.info(f"Warmed {warmed}/{size} database connections")
+    return warmed
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
     
@@ -110,15 +193,12 @@ def get_db() -> Generator[Session, None, None]:
             detail="Database service is not available. Please try again later."
         )
     
-    db = _SessionLocal()
-    try:
+    async with _SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-@contextmanager
-def get_db_context() -> Generator[Session, None, None]:
+@asynccontextmanager
+async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     """
     Context manager for database session.
     
@@ -128,14 +208,11 @@ def get_db_context() -> Generator[Session, None, None]:
     if _SessionLocal is None:
         raise RuntimeError("Database not initialized. Call init_database() first.")
     
-    db = _SessionLocal()
-    try:
+    async with _SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_engine() -> Engine:
+def get_engine() -> AsyncEngine:
     """Get database engine."""
     if _engine is None:
         raise RuntimeError("Database not initialized. Call init_database() first.")
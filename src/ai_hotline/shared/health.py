@@ -31,14 +31,12 @@ class HealthChecker:
         """Check PostgreSQL database connectivity and basic operations."""
         start_time = time.time()
         try:
-            with get_db_context() as session:
+            async with get_db_context() as session:
                 # Test basic connectivity
-                result = session.execute(text("SELECT 1 as test"))
-                test_value = result.scalar()
+                test_value = await session.scalar(text("SELECT 1 as test"))
                 
                 # Test database version
-                version_result = session.execute(text("SELECT version()"))
-                db_version = version_result.scalar()
+                db_version = await session.scalar(text("SELECT version()"))
                 
                 response_time = time.time() - start_time
                 
@@ -1,25 +1,29 @@
 """Authentication and authorization utilities."""
 
 import hashlib
+import hmac
 import secrets
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence, Tuple
 from uuid import UUID
 import bcrypt
-from jose import jwt
-from pydantic import BaseModel
+import orjson
+from jose import JWTError, jws, jwt
 
+from ..cache.ttl_cache import TTLCache
 from ..config.settings import get_settings
 
 
-class TokenData(BaseModel):
-    """Token data structure."""
+@dataclass(frozen=True, slots=True)
+class TokenData:
+    """Token data structure; identifiers are parsed to UUIDs once, at verification."""
     
-    user_id: str
+    user_id: UUID
     username: str
-    tenant_id: str
+    tenant_id: UUID
     email: str
-    roles: list[str]
+    roles: Tuple[str, ...]
     exp: datetime
     iat: datetime
     jti: str
@@ -28,9 +32,20 @@ class TokenData(BaseModel):
 class PasswordManager:
     """Password hashing and verification manager."""
     
-    def __init__(self):
-        """Initialize password manager."""
+    def __init__(self, verify_cache_size: int = 10_000, verify_cache_ttl_seconds: float = 60.0):
+        """Initialize password manager.
+        
+        Args:
+            verify_cache_size: Maximum number of cached verification results
+            verify_cache_ttl_seconds: How long a verification result is reused
+        """
         self.rounds = 12
+        
+        # Recent verification outcomes keyed by a peppered HMAC of the
+        # (hash, password) pair, so retries of the same password skip bcrypt.
+        # No plaintext is stored and the pepper never leaves this process.
+        self._verify_pepper = secrets.token_bytes(32)
+        self._verify_cache: TTLCache[bool] = TTLCache(verify_cache_size, verify_cache_ttl_seconds)
     
     def hash_password(self, password: str) -> str:
         """Hash a password using bcrypt.
@@ -46,12 +61,14 @@ class PasswordManager:
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
     
-    def verify_password(self, password: str, hashed_password: str) -> bool:
+    def verify_password(self, password: str, hashed_password: str, use_cache: bool = True) -> bool:
         """Verify a password against its hash.
         
         Args:
             password: Plain text password
             hashed_password: Hashed password to verify against
+            use_cache: Reuse and record recent results; pass False when every
+                call must pay the full bcrypt cost
             
         Returns:
             True if password matches, False otherwise
@@ -59,9 +76,43 @@ class PasswordManager:
         try:
             password_bytes = password.encode('utf-8')
             hashed_bytes = hashed_password.encode('utf-8')
-            return bcrypt.checkpw(password_bytes, hashed_bytes)
         except Exception:
             return False
+        
+        if not use_cache:
+            try:
+                return bcrypt.checkpw(password_bytes, hashed_bytes)
+            except Exception:
+                return False
+        
+        cache_key = hmac.new(
+            self._verify_pepper, hashed_bytes + b"\0" + password_bytes, hashlib.sha256
+        ).digest()[:16]
+        cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            result = bcrypt.checkpw(password_bytes, hashed_bytes)
+        except Exception:
+            return False
+        
+        self._verify_cache.set(cache_key, result)
+        return result
+    
+    def needs_update(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with a different bcrypt cost than the current one.
+        
+        Args:
+            hashed_password: Stored password hash
+            
+        Returns:
+            True if the password should be rehashed
+        """
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
     
     def generate_random_password(self, length: int = 12) -> str:
         """Generate a cryptographically secure random password.
@@ -87,13 +138,21 @@ class TokenManager:
         self.access_token_expire_minutes = self.settings.security.access_token_expire_minutes
         self.refresh_token_expire_days = self.settings.security.refresh_token_expire_days
     
+    def _encode(self, payload: Dict[str, Any]) -> str:
+        """Sign a payload whose time claims are already integer timestamps.
+        
+        Serializes with orjson and signs the bytes directly, skipping the
+        stdlib json encoding and claim conversion done by jwt.encode.
+        """
+        return jws.sign(orjson.dumps(payload), self.secret_key, algorithm=self.algorithm)
+    
     def create_access_token(
         self,
         user_id: str | UUID,
         username: str,
         tenant_id: str | UUID,
         email: str,
-        roles: list[str],
+        roles: Sequence[str],
         expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create an access token.
@@ -126,13 +185,13 @@ class TokenManager:
             "tenant_id": tenant_id_str,
             "email": email,
             "roles": roles,
-            "exp": expire,
-            "iat": now,
+            "exp": int(expire.timestamp()),
+            "iat": int(now.timestamp()),
             "jti": secrets.token_urlsafe(16),
             "type": "access"
         }
         
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return self._encode(payload)
     
     def create_refresh_token(
         self,
@@ -164,13 +223,13 @@ class TokenManager:
         payload = {
             "sub": user_id_str,
             "tenant_id": tenant_id_str,
-            "exp": expire,
-            "iat": now,
+            "exp": int(expire.timestamp()),
+            "iat": int(now.timestamp()),
             "jti": secrets.token_urlsafe(16),
             "type": "refresh"
         }
         
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return self._encode(payload)
     
     def decode_token(self, token: str) -> Dict[str, Any]:
         """Decode and validate a JWT token.
@@ -182,7 +241,7 @@ class TokenManager:
             Token payload
             
         Raises:
-            jwt.InvalidTokenError: If token is invalid
+            JWTError: If token is invalid or expired
         """
         return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
     
@@ -204,16 +263,16 @@ class TokenManager:
             
             # Extract token data
             return TokenData(
-                user_id=payload["sub"],
+                user_id=UUID(payload["sub"]),
                 username=payload["username"],
-                tenant_id=payload["tenant_id"],
+                tenant_id=UUID(payload["tenant_id"]),
                 email=payload["email"],
-                roles=payload["roles"],
+                roles=tuple(payload["roles"]),
                 exp=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
                 iat=datetime.fromtimestamp(payload["iat"], tz=timezone.utc),
                 jti=payload["jti"]
             )
-        except (jwt.InvalidTokenError, KeyError, ValueError):
+        except (JWTError, KeyError, ValueError, TypeError):
             return None
     
     def is_token_blacklisted(self, jti: str) -> bool:
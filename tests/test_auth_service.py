@@ -0,0 +1,173 @@
+"""Test token handling and login paths of the authentication service."""
+
+import asyncio
+import sys
+import os
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai_hotline.shared.cache import ttl_cache
+from src.ai_hotline.shared.exceptions import AuthenticationError
+from src.ai_hotline.shared.security import auth as security_auth
+from src.ai_hotline.shared.security.auth import password_manager, token_manager
+from src.ai_hotline.modules.identity.domain.entities.user import User, UserStatus
+from src.ai_hotline.modules.identity.application.services import auth_service
+from src.ai_hotline.modules.identity.application.services.auth_service import AuthenticationService
+
+
+class FakeUserRepository:
+    """In-memory user lookups that count database hits."""
+
+    def __init__(self, user):
+        self.user = user
+        self.lookups = 0
+        self.login_result = None
+
+    async def get_by_id(self, user_id):
+        self.lookups += 1
+        return self.user if user_id == self.user.id else None
+
+    async def get_by_email(self, email):
+        return self.user if email == self.user.email else None
+
+    async def record_login_result(self, user_id, success, max_attempts=5, lockout_minutes=30):
+        return self.login_result
+
+
+@pytest.fixture
+def user():
+    return User(
+        tenant_id=uuid4(),
+        email="user@example.com",
+        username="user",
+        password_hash="x",
+        status=UserStatus.ACTIVE,
+    )
+
+
+@pytest.fixture
+def repo(user):
+    return FakeUserRepository(user)
+
+
+@pytest.fixture
+def service(repo):
+    auth_service._token_user_cache.clear()
+    yield AuthenticationService(repo, tenant_repository=None)
+    auth_service._token_user_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the TTL caches."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def access_token_for(user, expires_delta=None):
+    return token_manager.create_access_token(
+        user_id=str(user.id),
+        username=user.username,
+        tenant_id=user.tenant_id,
+        email=user.email,
+        roles=("user",),
+        expires_delta=expires_delta,
+    )
+
+
+def refresh_token_for(user):
+    return token_manager.create_refresh_token(user_id=str(user.id), tenant_id=user.tenant_id)
+
+
+def test_refresh_token_is_not_an_access_token(service, user):
+    """Refresh tokens are rejected where an access token is required."""
+    token = refresh_token_for(user)
+
+    with pytest.raises(AuthenticationError, match="Invalid token"):
+        asyncio.run(service.verify_token_and_get_user(token))
+    with pytest.raises(AuthenticationError, match="Invalid token"):
+        asyncio.run(service.verify_token_claims(token))
+
+
+def test_refresh_requires_refresh_token(service, user):
+    """Only refresh tokens can be exchanged for a new access token."""
+    with pytest.raises(AuthenticationError, match="Invalid token type"):
+        asyncio.run(service.refresh_access_token(access_token_for(user)))
+
+    access_token = asyncio.run(service.refresh_access_token(refresh_token_for(user)))
+    assert token_manager.verify_token(access_token).user_id == user.id
+
+
+def test_token_cache_never_outlives_token(service, repo, user, clock):
+    """Cached users expire with a short-lived token, not after the full TTL."""
+    token = access_token_for(user, expires_delta=timedelta(seconds=10))
+
+    asyncio.run(service.verify_token_and_get_user(token))
+    asyncio.run(service.verify_token_and_get_user(token))
+    assert repo.lookups == 1
+
+    # Well inside the default TTL, but past the token's own expiry
+    clock.value += 11
+    assert clock.value - 1000.0 < auth_service.TOKEN_USER_CACHE_TTL_SECONDS
+    assert auth_service._token_user_cache.get(auth_service._token_cache_key(token)) is None
+
+
+def test_token_cache_expires_after_ttl(service, repo, user, clock):
+    """Entries are reloaded once the cache TTL has passed."""
+    token = access_token_for(user)
+
+    cached = asyncio.run(service.verify_token_and_get_user(token))
+    assert asyncio.run(service.verify_token_and_get_user(token)) is not cached
+    assert repo.lookups == 1
+
+    clock.value += auth_service.TOKEN_USER_CACHE_TTL_SECONDS + 1
+    asyncio.run(service.verify_token_and_get_user(token))
+    assert repo.lookups == 2
+
+
+def test_invalidate_user_tokens(service, repo, user, clock):
+    """Invalidating a user drops every cached token for them."""
+    tokens = [access_token_for(user, expires_delta=timedelta(minutes=n)) for n in (5, 6)]
+    for token in tokens:
+        asyncio.run(service.verify_token_and_get_user(token))
+    assert repo.lookups == 2
+
+    service.invalidate_user_tokens(user.id)
+    for token in tokens:
+        asyncio.run(service.verify_token_and_get_user(token))
+    assert repo.lookups == 4
+
+
+def test_login_refused_when_locked_concurrently(service, repo, user):
+    """A correct password does not clear a lock placed after the user was read."""
+    user.password_hash = password_manager.hash_password("Secret123!")
+    repo.login_result = None
+
+    with pytest.raises(AuthenticationError, match="temporarily locked"):
+        asyncio.run(service.authenticate_user(user.email, "Secret123!"))
+    assert user.last_login_at is None
+
+
+def test_unknown_emails_each_pay_for_bcrypt(service, monkeypatch):
+    """A password sprayed across unknown emails is checked in full every time."""
+    checks = []
+    checkpw = security_auth.bcrypt.checkpw
+
+    def counting_checkpw(password, hashed):
+        checks.append(hashed)
+        return checkpw(password, hashed)
+
+    monkeypatch.setattr(security_auth.bcrypt, "checkpw", counting_checkpw)
+
+    for email in ("missing1@example.com", "missing2@example.com"):
+        with pytest.raises(AuthenticationError, match="Invalid email or password"):
+            asyncio.run(service.authenticate_user(email, "Secret123!"))
+
+    assert len(checks) == 2
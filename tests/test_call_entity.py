@@ -0,0 +1,60 @@
+"""Test the Call domain entity."""
+
+import sys
+import os
+from uuid import uuid4
+
+import pytest
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_hotline.modules.call_processing.domain.entities.call import (
+    Call,
+    CallDirection,
+    CallStatus,
+)
+
+
+def make_call(phone_number: str = "+20 (100) 123-4567") -> Call:
+    return Call(tenant_id=uuid4(), phone_number=phone_number, direction=CallDirection.INBOUND)
+
+
+def test_phone_number_is_cleaned():
+    """Formatting characters are stripped from the phone number."""
+    assert make_call().phone_number == "+201001234567"
+
+
+def test_phone_number_length_is_validated():
+    """Too short phone numbers are rejected."""
+    with pytest.raises(ValueError):
+        make_call("123-45")
+
+
+def test_containers_are_allocated_lazily():
+    """Unused collections stay empty without allocating lists."""
+    call = make_call()
+    assert call.audio_file_paths == ()
+    assert call.transcript_segments == ()
+
+    call.add_audio_file("recording.wav")
+    call.add_audio_file("recording.wav")
+    assert list(call.audio_file_paths) == ["recording.wav"]
+
+
+def test_call_lifecycle():
+    """A started call ends with a duration and summary timestamps."""
+    call = make_call()
+    call.start_call("session-1")
+    call.add_transcript_segment("مرحبا", "caller")
+    call.end_call("error: line dropped")
+
+    summary = call.get_call_summary()
+    assert call.status == CallStatus.FAILED
+    assert call.is_completed
+    assert call.duration_seconds == 0
+    assert summary.started_at is not None
+    assert summary.transcript_segments_count == 1
+    assert b'"status":"failed"' in summary.to_json()
+    assert list(call.error_messages) == ["error: line dropped"]
+    assert call.get_full_transcript() == "caller: مرحبا"
@@ -0,0 +1,133 @@
+"""Test the CallSession domain entity."""
+
+import sys
+import os
+from uuid import uuid4
+
+import pytest
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_hotline.modules.call_processing.domain.entities.call_session import (
+    CallSession,
+    CallSessionPool,
+    HISTORY_MAX_LENGTH,
+    PENDING_EVENTS_MAX_LENGTH,
+    SessionState,
+)
+
+
+def make_session() -> CallSession:
+    return CallSession(call_id=uuid4(), tenant_id=uuid4())
+
+
+def test_conversation_context_keeps_recent_turns():
+    """Context holds the last turns while history stays bounded."""
+    session = make_session()
+    for i in range(HISTORY_MAX_LENGTH):
+        session.add_user_input(f"question {i}")
+        session.add_ai_response(f"answer {i}", provider="test", model="test")
+        session.add_system_message("tick")
+
+    context = session.get_conversation_context(max_turns=3)
+    assert [turn["text"] for turn in context] == [
+        f"answer {HISTORY_MAX_LENGTH - 2}",
+        f"question {HISTORY_MAX_LENGTH - 1}",
+        f"answer {HISTORY_MAX_LENGTH - 1}",
+    ]
+    assert len(session.conversation_history) == HISTORY_MAX_LENGTH
+    assert session.get_session_summary()["conversation_turns"] == 2 * HISTORY_MAX_LENGTH
+
+
+def test_conversation_context_size_is_configurable():
+    """Sessions keep as many turns as configured and reject larger requests."""
+    session = CallSession(call_id=uuid4(), tenant_id=uuid4(), max_context_turns=30)
+    for i in range(40):
+        session.add_user_input(f"question {i}")
+        session.add_ai_response(f"answer {i}", provider="test", model="test")
+
+    assert session.context_capacity == 60
+    assert len(session.get_conversation_context(max_turns=60)) == 60
+    with pytest.raises(ValueError):
+        session.get_conversation_context(max_turns=61)
+
+
+def test_session_state_transitions():
+    """Recording and playback move the session through its states."""
+    session = make_session()
+    session.start_recording("stream-1")
+    assert session.state == SessionState.LISTENING
+    session.add_user_input("مرحبا", confidence=0.9)
+    assert session.state == SessionState.PROCESSING
+
+    session.add_pending_request("llm", "req-1")
+    assert session.has_pending_requests()
+    session.remove_pending_request("llm", "req-1")
+    session.remove_pending_request("llm", "missing")
+    assert not session.has_pending_requests()
+
+    session.end_session()
+    assert session.state == SessionState.ENDED
+    assert not session.is_expired()
+    assert isinstance(session.get_session_summary()["created_at"], str)
+
+
+def test_session_pool_reuses_released_sessions():
+    """Released sessions are reset and handed out again."""
+    pool = CallSessionPool(max_size=1)
+    session = pool.acquire(uuid4(), uuid4())
+    session.add_user_input("secret")
+    session.add_pending_request("stt", "req-1")
+    session.set_metadata("caller", "x")
+    session.end_session()
+    pool.release(session)
+    assert session.last_user_input is None
+    assert len(pool) == 1
+
+    call_id = uuid4()
+    reused = pool.acquire(call_id, uuid4(), "session-2")
+    assert reused is session
+    assert reused.call_id == call_id
+    assert reused.session_id == "session-2"
+    assert reused.state == SessionState.INITIALIZING
+    assert reused.get_conversation_context() == []
+    assert reused.get_metadata("caller") is None
+    assert not reused.has_pending_requests()
+    assert len(pool) == 0
+
+
+def test_new_events_are_handed_out_once():
+    """Recorded events are queued for persistence until taken."""
+    session = make_session()
+    session.add_user_input("hello")
+    session.add_system_message("tick")
+
+    events = session.take_new_events()
+    assert [event.type for event in events] == ["user_input", "system_message"]
+    assert session.take_new_events() == []
+
+
+def test_undrained_event_queue_stays_bounded():
+    """A long session whose events are never taken keeps a bounded queue."""
+    session = make_session()
+    total = 3 * PENDING_EVENTS_MAX_LENGTH
+    for i in range(total):
+        session.add_system_message(f"tick {i}")
+
+    assert session.dropped_event_count == total - PENDING_EVENTS_MAX_LENGTH
+    events = session.take_new_events()
+    assert len(events) == PENDING_EVENTS_MAX_LENGTH
+    assert events[-1].message == f"tick {total - 1}"
+
+
+def test_batch_sweeps_use_one_timestamp():
+    """Batch checks flag the same sessions as the per-session checks."""
+    fresh, stale = make_session(), make_session()
+    stale.created_at -= stale.max_session_duration_seconds + 1
+    stale.last_activity_at -= stale.max_silence_duration_seconds + 1
+    now = fresh.created_at + 1
+
+    assert CallSession.check_expired_batch([fresh, stale], now) == [stale]
+    assert CallSession.check_idle_batch([fresh, stale], now) == [stale]
+    assert stale.is_expired(now) and not fresh.is_idle(now)
@@ -0,0 +1,72 @@
+"""Test the tenant repository."""
+
+import asyncio
+import sys
+import os
+from uuid import uuid4
+
+from sqlalchemy import inspect
+from sqlalchemy.orm.session import make_transient_to_detached
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai_hotline.modules.identity.infrastructure.persistence.models import TenantModel
+from src.ai_hotline.modules.identity.infrastructure.repositories.tenant_repository import SqlAlchemyTenantRepository
+
+
+class IdentityMapSession:
+    """Returns the same loaded model for every query, like a session's identity map."""
+
+    def __init__(self, model):
+        self.model = model
+        self.dirty_on_commit = None
+
+    async def scalar(self, statement):
+        return self.model
+
+    async def commit(self):
+        self.dirty_on_commit = inspect(self.model).attrs.features.history.has_changes()
+
+    async def rollback(self):
+        pass
+
+
+def loaded_tenant_model() -> TenantModel:
+    model = TenantModel(
+        id=uuid4(),
+        name="acme",
+        display_name="Acme",
+        contact_email="admin@acme.io",
+        status="active",
+        max_users=10,
+        max_calls_per_month=1000,
+        max_storage_mb=1024,
+        features={"call_recording": True},
+        settings={"default_voice": "arabic_female_1"},
+    )
+    for column in TenantModel.__table__.columns:
+        if column.key not in model.__dict__:
+            setattr(model, column.key, None)
+    # Mark the current values as loaded from the database
+    make_transient_to_detached(model)
+    return model
+
+
+def test_feature_change_is_written():
+    """Changing a loaded tenant's features makes update write the column."""
+    model = loaded_tenant_model()
+    session = IdentityMapSession(model)
+    repo = SqlAlchemyTenantRepository(session)
+
+    async def run():
+        tenant = await repo.get_by_id(model.id)
+        tenant.enable_feature("automation")
+        assert "automation" not in model.features
+        return await repo.update(tenant)
+
+    updated = asyncio.run(run())
+
+    assert session.dirty_on_commit
+    assert model.features["automation"] is True
+    assert updated.has_feature("automation")
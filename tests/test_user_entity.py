@@ -0,0 +1,74 @@
+"""Test the User and Tenant domain entities."""
+
+import sys
+import os
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai_hotline.modules.identity.domain.entities import user as user_module
+from src.ai_hotline.modules.identity.domain.entities.user import User
+from src.ai_hotline.modules.identity.domain.entities.tenant import Tenant
+
+
+FROZEN_NOW = datetime(2026, 10, 15, 10, 45)
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def utcnow(cls):
+        return FROZEN_NOW
+
+
+def make_user() -> User:
+    return User(tenant_id=uuid4(), email="user@example.com", username="user", password_hash="x")
+
+
+def make_tenant() -> Tenant:
+    return Tenant(name="acme", display_name="Acme", contact_email="admin@acme.io")
+
+
+def test_lockout_past_the_half_hour(monkeypatch):
+    """Locking at minute >= 30 rolls over into the next hour."""
+    monkeypatch.setattr(user_module, "datetime", FrozenDatetime)
+    monkeypatch.setattr(user_module, "_utcnow", FrozenDatetime.utcnow)
+    user = make_user()
+
+    user.lock_account(30)
+    assert user.locked_until == FROZEN_NOW + timedelta(minutes=30)
+    assert user.is_locked
+
+
+def test_failed_logins_lock_at_threshold(monkeypatch):
+    """The account locks once the attempt limit is reached."""
+    monkeypatch.setattr(user_module, "datetime", FrozenDatetime)
+    monkeypatch.setattr(user_module, "_utcnow", FrozenDatetime.utcnow)
+    user = make_user()
+
+    for _ in range(4):
+        user.record_failed_login(max_attempts=5, lockout_minutes=45)
+    assert user.locked_until is None
+
+    user.record_failed_login(max_attempts=5, lockout_minutes=45)
+    assert user.locked_until == FROZEN_NOW + timedelta(minutes=45)
+
+    user.record_login()
+    assert not user.is_locked
+    assert user.failed_login_attempts == 0
+
+
+def test_tenant_defaults_are_copied_on_write():
+    """Tenants share default features/settings until one of them changes."""
+    first, second = make_tenant(), make_tenant()
+    assert first.features is second.features
+
+    first.enable_feature("automation")
+    first.update_setting("default_voice", "custom")
+
+    assert first.has_feature("automation")
+    assert not second.has_feature("automation")
+    assert second.get_setting("default_voice") == "arabic_female_1"
+    assert first.features is not second.features
+    assert first.to_dict()["settings"]["default_voice"] == "custom"
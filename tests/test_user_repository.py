@@ -0,0 +1,219 @@
+"""Test the user repository and its caching decorator."""
+
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai_hotline.shared.exceptions import ValidationError
+from src.ai_hotline.modules.identity.domain.entities.user import User
+from src.ai_hotline.modules.identity.domain.repositories import LoginState, MAX_PAGE_SIZE
+from src.ai_hotline.modules.identity.infrastructure.repositories.user_repository import SqlAlchemyUserRepository
+from src.ai_hotline.modules.identity.infrastructure.repositories.caching_user_repository import (
+    CachingUserRepository,
+    UserLookupCache,
+)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeSession:
+    """Records executed statements instead of talking to a database."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.rows)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    def compiled(self, index=-1):
+        statement = self.statements[index].compile(dialect=postgresql.dialect())
+        return str(statement), statement.params
+
+
+class GatedRepository:
+    """Inner repository whose lookups block until released."""
+
+    def __init__(self, user):
+        self.user = user
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.login_state = None
+
+    async def get_by_id(self, user_id):
+        self.calls += 1
+        await self.gate.wait()
+        return self.user
+
+    async def update(self, user):
+        self.user = user
+        return user
+
+    async def record_login_result(self, user_id, success, max_attempts=5, lockout_minutes=30):
+        return self.login_state
+
+
+def make_user() -> User:
+    return User(tenant_id=uuid4(), email="user@example.com", username="user", password_hash="x")
+
+
+def test_successful_login_keeps_an_active_lock():
+    """A success only clears the lock when it has already expired."""
+    user_id = uuid4()
+    session = FakeSession()
+    repo = SqlAlchemyUserRepository(session)
+
+    assert asyncio.run(repo.record_login_result(user_id, True)) is None
+
+    sql, params = session.compiled()
+    assert "users.locked_until IS NULL OR users.locked_until <=" in sql
+    assert params["failed_login_attempts"] == 0
+    assert params["locked_until"] is None
+    assert session.commits == 1
+
+
+def test_failed_login_locks_in_the_update():
+    """Failures bump the counter and set the lock with a CASE expression."""
+    locked_until = datetime.utcnow() + timedelta(minutes=30)
+    session = FakeSession([(5, locked_until, None)])
+    repo = SqlAlchemyUserRepository(session)
+
+    state = asyncio.run(repo.record_login_result(uuid4(), False, max_attempts=5))
+
+    assert state == LoginState(5, locked_until, None)
+    sql, _ = session.compiled()
+    assert "CASE WHEN" in sql
+    assert "users.locked_until IS NULL" not in sql
+
+
+def test_list_by_tenant_clamps_limit():
+    """Page sizes are clamped to [1, MAX_PAGE_SIZE] and skip can't be negative."""
+    session = FakeSession()
+    repo = SqlAlchemyUserRepository(session)
+
+    asyncio.run(repo.list_by_tenant(uuid4(), limit=MAX_PAGE_SIZE * 10))
+    assert session.compiled()[1]["param_1"] == MAX_PAGE_SIZE
+
+    asyncio.run(repo.list_by_tenant(uuid4(), limit=0))
+    assert session.compiled()[1]["param_1"] == 1
+
+    with pytest.raises(ValidationError):
+        asyncio.run(repo.list_by_tenant(uuid4(), skip=-1))
+
+
+def test_list_by_tenant_keyset_pagination():
+    """Passing last_id continues after that ID instead of using OFFSET."""
+    last_id = uuid4()
+    session = FakeSession()
+    repo = SqlAlchemyUserRepository(session)
+
+    asyncio.run(repo.list_by_tenant(uuid4(), limit=10, last_id=last_id))
+
+    sql, params = session.compiled()
+    assert "users.id > %(id_1)s" in sql
+    assert "ORDER BY users.id" in sql
+    assert "OFFSET" not in sql
+    assert params["id_1"] == last_id
+
+
+def test_concurrent_misses_share_one_load():
+    """Concurrent lookups of the same user hit the inner repository once."""
+    user = make_user()
+    inner = GatedRepository(user)
+    repo = CachingUserRepository(inner, UserLookupCache())
+
+    async def run():
+        lookups = [asyncio.create_task(repo.get_by_id(user.id)) for _ in range(3)]
+        await asyncio.sleep(0)
+        inner.gate.set()
+        return await asyncio.gather(*lookups)
+
+    results = asyncio.run(run())
+
+    assert inner.calls == 1
+    assert all(result == user for result in results)
+    assert all(result is not user for result in results)
+    assert len({id(result) for result in results}) == 3
+
+
+def test_update_evicts_cached_user():
+    """A write evicts the user so the next lookup reloads it."""
+    user = make_user()
+    inner = GatedRepository(user)
+    inner.gate.set()
+    repo = CachingUserRepository(inner, UserLookupCache())
+
+    async def run():
+        await repo.get_by_id(user.id)
+        await repo.get_by_id(user.id)
+        assert inner.calls == 1
+        await repo.update(user)
+        await repo.get_by_id(user.id)
+
+    asyncio.run(run())
+    assert inner.calls == 2
+
+
+def test_evict_during_load_skips_store():
+    """A row read before a concurrent eviction is not cached."""
+    user = make_user()
+    inner = GatedRepository(user)
+    cache = UserLookupCache()
+    repo = CachingUserRepository(inner, cache)
+
+    async def run():
+        lookup = asyncio.create_task(repo.get_by_id(user.id))
+        await asyncio.sleep(0)
+        cache.evict(user.id)
+        inner.gate.set()
+        return await lookup
+
+    assert asyncio.run(run()) == user
+    assert cache.by_id.get(user.id) is None
+
+
+def test_status_changing_writes_notify_listener():
+    """Updates and lockouts are reported so token caches can drop the user."""
+    user = make_user()
+    inner = GatedRepository(user)
+    changed = []
+    repo = CachingUserRepository(inner, UserLookupCache(), on_user_changed=changed.append)
+
+    asyncio.run(repo.update(user))
+    assert changed == [user.id]
+
+    inner.login_state = LoginState(1, None, None)
+    asyncio.run(repo.record_login_result(user.id, False))
+    inner.login_state = LoginState(0, None, datetime.utcnow())
+    asyncio.run(repo.record_login_result(user.id, True))
+    assert changed == [user.id]
+
+    inner.login_state = LoginState(5, datetime.utcnow() + timedelta(minutes=30), None)
+    asyncio.run(repo.record_login_result(user.id, False))
+    assert changed == [user.id, user.id]